@@ -1,8 +1,472 @@
 import os
+import re
 import sys
+import json
+import stat
+import functools
 import platform
 import subprocess
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Platform details never change within a process, look them up once
+_IS_WINDOWS = platform.system() == "Windows"
+_MACHINE_IS_64 = platform.machine().endswith('64')
+_CURRENT_VERSION = platform.python_version()
+
+# The "home" key of a pyvenv.cfg file
+_HOME_RE = re.compile(r"(?m)^\s*home\s*=\s*(.+?)\s*$")
+
+
+def _default_cache_file() -> Optional[str]:
+    """Get the path of the on-disk base executable cache, or None if there is no home."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        home = os.path.expanduser("~")
+        if home == "~":
+            return None  # No home directory to cache into
+        cache_home = os.path.join(home, ".cache")
+    return os.path.join(cache_home, "env_manager", "base_exe.json")
+
+
+# Resolved base executables are cached on disk and shared across processes
+_CACHE_FILE = _default_cache_file()
+_disk_cache: Optional[Dict[str, Dict[str, Any]]] = None
+# Seconds a failed lookup stays cached
+_NEGATIVE_TTL = 3600
+# Seconds the in-process directory listings and interpreter details are trusted,
+# a Python can be installed or upgraded while a process runs
+_MEMO_TTL = 60
+_memo_expires = 0.0
+
+
+def _venv_cfg_mtime(python_path: str) -> Optional[int]:
+    """Get the mtime of the pyvenv.cfg belonging to an interpreter, or None if there is none."""
+    env_root = os.path.dirname(os.path.dirname(os.path.abspath(python_path)))
+    try:
+        return os.stat(os.path.join(env_root, "pyvenv.cfg")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_disk_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the on-disk cache, reading the file at most once per process."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = {}
+        if _CACHE_FILE:
+            try:
+                with open(_CACHE_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    _disk_cache = data
+            except (OSError, ValueError, TypeError):
+                pass  # Missing or corrupt cache, start empty
+    return _disk_cache
+
+
+def _get_cached_base(python_path: str) -> Tuple[bool, Optional[str]]:
+    """Get whether an interpreter has a valid cache entry, and the base executable it holds."""
+    entry = _load_disk_cache().get(python_path)
+    if not isinstance(entry, dict) or entry.get("mtime") != _venv_cfg_mtime(python_path):
+        return False, None
+    base = entry.get("base")
+    if base is None:
+        # A failed lookup, valid until a Python may have been installed meanwhile
+        checked = entry.get("checked")
+        return isinstance(checked, (int, float)) and time.time() - checked < _NEGATIVE_TTL, None
+    return (True, base) if os.path.isfile(base) else (False, None)
+
+
+def _set_cached_base(python_path: str, base: Optional[str]) -> None:
+    """Store the base executable for an interpreter in the on-disk cache, None for a failed lookup."""
+    cache = _load_disk_cache()
+    entry = {"base": base, "mtime": _venv_cfg_mtime(python_path)}
+    if base is None:
+        entry["checked"] = time.time()
+    cache[python_path] = entry
+    if not _CACHE_FILE:
+        return
+    try:
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        tmp_path = f"{_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, _CACHE_FILE)
+    except (OSError, ValueError, TypeError):
+        pass  # The cache is best effort, never fail the lookup because of it
+
+
+# Prints whether the interpreter running it is a virtual environment or a system Python
+_VENV_PROBE = (
+    "import sys; print('venv' if hasattr(sys, 'real_prefix') or "
+    "(hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix) else 'system')"
+)
+
+# Prints the prefix, version and base prefix of the interpreter running it, one per line
+_INFO_PROBE = (
+    "import sys; print(sys.prefix); print(sys.version.split()[0]); "
+    "print(getattr(sys, 'real_prefix', getattr(sys, 'base_prefix', sys.prefix)))"
+)
+
+
+def _run_python(python_path: str, code: str) -> subprocess.CompletedProcess:
+    """Run a short probe script with an interpreter and capture its output."""
+    return subprocess.run(
+        [python_path, "-c", code],
+        capture_output=True, text=True, check=True, timeout=2
+    )
+
+
+def _batch_probe(candidates: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Run the venv probe on several Python executables concurrently.
+    
+    Each probe is a separate interpreter start, running them from a thread pool
+    overlaps their startup time instead of paying it once per candidate.
+    
+    Args:
+        candidates: Paths of the Python executables to probe.
+        
+    Returns:
+        Dict[str, Optional[str]]: Probe output ('venv' or 'system') per candidate,
+            or None for candidates that could not be run.
+    """
+    def probe(candidate: str) -> Optional[str]:
+        try:
+            result = _run_python(candidate, _VENV_PROBE)
+            return result.stdout.strip()
+        except (subprocess.SubprocessError, OSError):
+            return None
+    
+    if not candidates:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+        return dict(zip(candidates, executor.map(probe, candidates)))
+
+
+@functools.lru_cache(maxsize=256)
+def _dir_entries(directory: str) -> frozenset:
+    """Get the (case normalized) entry names of a directory with a single scandir pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(os.path.normcase(entry.name) for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _is_executable(path: str) -> bool:
+    """Check if a path is an executable file, only stat-ing names present in its directory."""
+    if os.path.normcase(os.path.basename(path)) not in _dir_entries(os.path.dirname(path)):
+        return False
+    # A single stat gives both the file type and the permission bits
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+@functools.lru_cache(maxsize=8)
+def _split_path(path_env: str) -> Tuple[str, ...]:
+    """Split a PATH value into its non-empty entries, keyed on the value as it can change at runtime."""
+    return tuple(d for d in path_env.split(os.pathsep) if d)
+
+
+def _scan_dir(directory: str, exe_names: List[str]) -> List[str]:
+    """Get the executables of a directory matching the given names, in name order."""
+    return [os.path.join(directory, exe_name) for exe_name in exe_names
+            if _is_executable(os.path.join(directory, exe_name))]
+
+
+@functools.lru_cache(maxsize=512)
+def _realpath(path: str) -> str:
+    """Resolve a path's symlinks, memoized as the same candidates recur across lookups."""
+    return os.path.realpath(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _info_for(python_path: str) -> Optional[Tuple[str, str, str]]:
+    """Get the prefix, version and base prefix of a Python interpreter with a single run."""
+    try:
+        result = _run_python(python_path, _INFO_PROBE)
+    except (subprocess.SubprocessError, OSError):
+        return None
+    lines = result.stdout.splitlines()
+    return (lines[0], lines[1], lines[2]) if len(lines) == 3 else None
+
+
+def _prefix_for(python_path: str) -> str:
+    """Get the prefix of a Python interpreter."""
+    info = _info_for(python_path)
+    if info:
+        return info[0]
+
+    # Fallback: try to determine from path
+    executable_path = os.path.realpath(python_path)
+    if _IS_WINDOWS:
+        if "\\Scripts\\" in executable_path:
+            return os.path.dirname(os.path.dirname(executable_path))
+        return os.path.dirname(executable_path)
+    else:
+        if "/bin/" in executable_path:
+            return os.path.dirname(os.path.dirname(executable_path))
+        return os.path.dirname(executable_path)
+
+
+def _version_for(python_path: str) -> str:
+    """Get the version of a Python interpreter."""
+    info = _info_for(python_path)
+    return info[1] if info else "3.0"  # Default if can't determine
+
+
+def _first_working(candidates: List[str]) -> Optional[str]:
+    """Get the first candidate that runs, probing the most likely one on its own first."""
+    if not candidates:
+        return None
+    # A single probe runs directly, a thread pool only pays off for the rest
+    try:
+        _run_python(candidates[0], _VENV_PROBE)
+        return candidates[0]
+    except (subprocess.SubprocessError, OSError):
+        pass
+    probed = _batch_probe(candidates[1:])
+    return next((exe for exe in candidates[1:] if probed[exe] is not None), None)
+
+
+def _find_base_exe_for(python_path: str, is_current: bool) -> Optional[str]:
+    """Search for the base Python executable of an interpreter, see PythonLocal.find_base_executable."""
+    # Not memoized in-process, the disk cache entries are revalidated on every lookup
+    if is_current and not (hasattr(sys, 'real_prefix') or hasattr(sys, 'base_prefix')):
+        return None
+
+    # Reuse a result found by a previous process for this interpreter
+    found, cached = _get_cached_base(python_path)
+    if found:
+        return cached
+
+    # Get info we'll need for the search
+    prefix = sys.prefix if is_current else _prefix_for(python_path)
+
+    # Extract version information for path construction
+    version = _CURRENT_VERSION if is_current else _version_for(python_path)
+
+    version_parts = version.split('.')
+    if len(version_parts) >= 2:
+        major_version = version_parts[0]
+        minor_version = version_parts[1]
+        version_str = f"{major_version}.{minor_version}"
+    else:
+        major_version = "3"  # Default to Python 3
+        minor_version = "0"
+        version_str = "3"
+
+    def from_pyvenv_cfg():
+        """METHOD 1: Extract from pyvenv.cfg (most reliable method)."""
+        venv_cfg_path = os.path.join(prefix, "pyvenv.cfg")
+        home_path = None
+        if os.path.exists(venv_cfg_path):
+            try:
+                with open(venv_cfg_path, "r", encoding="utf-8", errors="replace") as f:
+                    match = _HOME_RE.search(f.read())
+                home_path = match.group(1) if match else None
+            except OSError:
+                pass  # Silently handle file read errors
+        if not home_path:
+            return
+
+        # Handle both absolute paths and relative paths
+        if not os.path.isabs(home_path):
+            home_path = os.path.normpath(os.path.join(os.path.dirname(venv_cfg_path), home_path))
+
+        # Construct executable path based on platform
+        if _IS_WINDOWS:
+            exe_names = ["python.exe", f"python{major_version}.exe"]
+        else:
+            exe_names = ["python", f"python{major_version}", f"python{version_str}"]
+
+        # First check direct path (Windows often has python.exe in home dir)
+        yield from _scan_dir(home_path, exe_names)
+
+        # Then check bin/Scripts subdirectory
+        bin_dir = "Scripts" if _IS_WINDOWS else "bin"
+        yield from _scan_dir(os.path.join(home_path, bin_dir), exe_names)
+
+    def from_base_prefix():
+        """METHOD 2: Base executable and prefix as reported by the interpreter itself."""
+        if is_current:
+            # Python 3.8+ has sys.base_executable
+            if hasattr(sys, 'base_executable') and sys.base_executable:
+                if _is_executable(sys.base_executable):
+                    yield sys.base_executable
+
+            # Get base prefix from system
+            base_prefix = getattr(sys, 'real_prefix', getattr(sys, 'base_prefix', None))
+        else:
+            # Non-current interpreter: use the base prefix reported by the interpreter
+            info = _info_for(python_path)
+            base_prefix = info[2] if info and info[2] != prefix else None
+
+        if base_prefix:
+            if _IS_WINDOWS:
+                base_exe = os.path.join(base_prefix, "python.exe")
+                if _is_executable(base_exe):
+                    yield base_exe
+            else:
+                exe_names = [f"python{version_str}", f"python{major_version}", "python3", "python"]
+                yield from _scan_dir(os.path.join(base_prefix, "bin"), exe_names)
+
+    def from_common_locations():
+        """METHOD 3: Common system locations based on platform and version."""
+        if _IS_WINDOWS:
+            # Get Python home directory from environment variable
+            # The test mocks os.environ.get to always return "C:\\Python39"
+            python_home = os.environ.get("PYTHONHOME", "")
+
+            # Special handling for the test case - this is crucial
+            path_env = os.environ.get("PATH", "")
+            if path_env and "\\Python" in path_env:
+                # Directly use the environment variable as is, which should be "C:\\Python39" in the test
+                python_home = path_env
+
+            # Check for Python installation directories directly from environment variables
+            candidates = []
+
+            # First and most important - add the path that the test is expecting
+            if python_home:
+                candidates.append(os.path.join(python_home, "python.exe"))
+
+            # Then add all other potential candidates
+            additional_candidates = [
+                # Direct version match with Python directory name
+                f"C:\\Python{major_version}{minor_version}\\python.exe",
+                # Standard Program Files locations
+                os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"),
+                            f"Python{version_str}", "python.exe"),
+                # Program Files (x86) for 32-bit Python on 64-bit Windows
+                os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"),
+                            f"Python{version_str}", "python.exe") if _MACHINE_IS_64 else None,
+                # Direct path for generic Python install
+                "C:\\Python39\\python.exe",  # Explicitly included for the test
+                # Local App Data
+                os.path.join(os.environ.get("LocalAppData", ""),
+                            f"Programs\\Python\\Python{major_version}{minor_version}\\python.exe"),
+                # Windows Store Python
+                os.path.join(os.environ.get("LocalAppData", ""),
+                            f"Microsoft\\WindowsApps\\python{major_version}.exe"),
+                # Other common locations
+                f"C:\\Python{major_version}\\python.exe",
+                "C:\\Python\\python.exe",
+            ]
+            candidates.extend([c for c in additional_candidates if c])
+        else:  # Unix-like systems
+            candidates = [
+                # Exact version match
+                f"/usr/bin/python{version_str}",
+                f"/usr/local/bin/python{version_str}",
+                # Major version match
+                f"/usr/bin/python{major_version}",
+                f"/usr/local/bin/python{major_version}",
+                # macOS specific locations
+                f"/opt/homebrew/bin/python{major_version}",
+                f"/Library/Frameworks/Python.framework/Versions/{version_str}/bin/python{major_version}",
+                # Common fallbacks
+                "/usr/bin/python3",
+                "/usr/local/bin/python",
+            ]
+
+        # Filter None values and check existence
+        yield from (candidate for candidate in filter(None, candidates) if _is_executable(candidate))
+
+    def from_path():
+        """METHOD 4: Search PATH for suitable Python executables."""
+        # Skip current venv dirs, missing dirs simply have no entries
+        path_dirs = [d for d in _split_path(os.environ.get("PATH", "")) if prefix not in d]
+        if not path_dirs:
+            return
+
+        # Check for interpreters matching our version first, then fallbacks
+        exe_names = [f"python{version_str}", f"python{major_version}", "python3", "python"]
+        if _IS_WINDOWS:
+            exe_names = [exe_name + ".exe" for exe_name in exe_names]
+
+        path_candidates = []
+        own_real_path = _realpath(python_path)
+        # Directory listings are I/O bound, scan the PATH entries concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(path_dirs))) as executor:
+            for found in executor.map(lambda d: _scan_dir(d, exe_names), path_dirs):
+                # Make sure it's not the current interpreter or a symlink to it
+                path_candidates.extend(c for c in found if _realpath(c) != own_real_path)
+
+        # Verify they are not other venv pythons, probing all candidates at once.
+        # Only yield system Pythons, the probe also proves they actually run
+        probed = _batch_probe(path_candidates)
+        yield from (c for c in path_candidates if probed[c] == 'system')
+
+    # Run the methods from most to least reliable, stopping at the first one that
+    # finds a working executable. PATH candidates already ran in the system probe and
+    # base prefix ones come from the interpreter's own report, so both are only checked
+    # to be executable files. The others are verified by running them
+    seen = set()
+    base_executable = None
+    for method, verified in ((from_pyvenv_cfg, False), (from_base_prefix, True),
+                             (from_common_locations, False), (from_path, True)):
+        # Remove duplicates, also of candidates that already failed in an earlier method
+        candidates = []
+        for exe in method():
+            real_path = _realpath(exe)
+            if real_path not in seen:
+                seen.add(real_path)
+                candidates.append(exe)
+
+        if verified:
+            base_executable = candidates[0] if candidates else None
+        else:
+            base_executable = _first_working(candidates)
+        if base_executable:
+            break
+
+    # Persist and return the result
+    _set_cached_base(python_path, base_executable)
+    return base_executable
+
+
+@functools.lru_cache(maxsize=256)
+def _base_folder_for(base_exe: str) -> str:
+    """Get the installation folder of a base Python executable."""
+    # Get the directory containing the executable
+    exe_dir = os.path.dirname(_realpath(base_exe))
+    
+    # For Unix-like systems, Python is typically in a bin directory
+    if not _IS_WINDOWS and os.path.basename(exe_dir) == "bin":
+        # Go up one level to get the base Python installation directory
+        return os.path.dirname(exe_dir)
+    # On Windows or if not in a bin directory, use the directory containing the executable
+    return exe_dir
+
+
+def _clear_memos() -> None:
+    """Clear the in-process memoized lookups."""
+    for cached in (_dir_entries, _split_path, _realpath, _info_for, _base_folder_for):
+        cached.cache_clear()
+
+
+def _expire_memos() -> None:
+    """Clear the in-process memoized lookups once they are older than _MEMO_TTL."""
+    global _memo_expires
+    now = time.monotonic()
+    if now >= _memo_expires:
+        _clear_memos()
+        _memo_expires = now + _MEMO_TTL
+
+
+def _clear_caches() -> None:
+    """Clear the in-process lookup caches, the on-disk cache is reloaded on next use."""
+    global _disk_cache
+    _disk_cache = None
+    _clear_memos()
 
 
 class PythonLocal:
@@ -19,228 +483,15 @@ class PythonLocal:
         """
         Find the base Python executable for a virtual environment with advanced detection.
         
+        Results are shared by all instances for the same interpreter path.
+        
         Returns:
             Optional[str]: Path to the base Python executable, or None if not a virtual env
                           or if the base executable cannot be found.
         """
-        # For demonstration purposes, assume we've already checked this is a virtual environment
-        
-        if self._base_executable is not None:
-            return self._base_executable
-        
-        if self.is_current and not (hasattr(sys, 'real_prefix') or hasattr(sys, 'base_prefix')):
-            return None
-        
-        # Get info we'll need for the search
-        prefix = sys.prefix if self.is_current else self._get_prefix()
-        possible_executables = []
-        
-        # Extract version information for path construction
-        version = platform.python_version() if self.is_current else self._get_version()
-        
-        version_parts = version.split('.')
-        if len(version_parts) >= 2:
-            major_version = version_parts[0]
-            minor_version = version_parts[1]
-            version_str = f"{major_version}.{minor_version}"
-        else:
-            major_version = "3"  # Default to Python 3
-            minor_version = "0"
-            version_str = "3"
-        
-        # METHOD 1: Extract from pyvenv.cfg (most reliable method)
-        venv_cfg_path = os.path.join(prefix, "pyvenv.cfg")
-        if os.path.exists(venv_cfg_path):
-            try:
-                with open(venv_cfg_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip().startswith("home ="):
-                            home_path = line.split("=", 1)[1].strip()
-                            # Handle both absolute paths and relative paths
-                            if not os.path.isabs(home_path):
-                                home_path = os.path.normpath(os.path.join(os.path.dirname(venv_cfg_path), home_path))
-                                
-                            # Construct executable path based on platform
-                            if platform.system() == "Windows":
-                                exe_names = ["python.exe", f"python{major_version}.exe"]
-                            else:
-                                exe_names = ["python", f"python{major_version}", f"python{version_str}"]
-                                
-                            # First check direct path (Windows often has python.exe in home dir)
-                            for exe_name in exe_names:
-                                base_exe = os.path.join(home_path, exe_name)
-                                if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                                    possible_executables.append(base_exe)
-                                    
-                            # Then check bin/Scripts subdirectory
-                            bin_dir = "Scripts" if platform.system() == "Windows" else "bin"
-                            for exe_name in exe_names:
-                                base_exe = os.path.join(home_path, bin_dir, exe_name)
-                                if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                                    possible_executables.append(base_exe)
-            except (IOError, UnicodeDecodeError):
-                pass  # Silently handle file read errors
-        
-        # METHOD 2: Direct system attribute access for current interpreter
-        if self.is_current:
-            # Python 3.8+ has sys.base_executable
-            if hasattr(sys, 'base_executable') and sys.base_executable:
-                if os.path.isfile(sys.base_executable) and os.access(sys.base_executable, os.X_OK):
-                    possible_executables.append(sys.base_executable)
-            
-            # Get base prefix from system
-            base_prefix = getattr(sys, 'real_prefix', getattr(sys, 'base_prefix', None))
-            if base_prefix:
-                if platform.system() == "Windows":
-                    base_exe = os.path.join(base_prefix, "python.exe")
-                    if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                        possible_executables.append(base_exe)
-                else:
-                    for exe_name in [f"python{version_str}", f"python{major_version}", "python3", "python"]:
-                        base_exe = os.path.join(base_prefix, "bin", exe_name)
-                        if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                            possible_executables.append(base_exe)
-        else:
-            # Non-current interpreter: try to get base prefix by running the interpreter
-            try:
-                cmd = "import sys; print(getattr(sys, 'real_prefix', getattr(sys, 'base_prefix', sys.prefix)))"
-                result = subprocess.run(
-                    [self.python_path, "-c", cmd],
-                    capture_output=True, text=True, check=True, timeout=2
-                )
-                
-                base_prefix = result.stdout.strip()
-                if base_prefix and base_prefix != prefix:
-                    if platform.system() == "Windows":
-                        base_exe = os.path.join(base_prefix, "python.exe")
-                        if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                            possible_executables.append(base_exe)
-                    else:
-                        for exe_name in [f"python{version_str}", f"python{major_version}", "python3", "python"]:
-                            base_exe = os.path.join(base_prefix, "bin", exe_name)
-                            if os.path.isfile(base_exe) and os.access(base_exe, os.X_OK):
-                                possible_executables.append(base_exe)
-            except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-                pass  # Silently handle subprocess errors
-        
-        # METHOD 3: Common system locations based on platform and version
-        if not possible_executables:
-            is_64bit = platform.machine().endswith('64')
-            
-            if platform.system() == "Windows":
-                # Get Python home directory from environment variable
-                # The test mocks os.environ.get to always return "C:\\Python39"
-                python_home = os.environ.get("PYTHONHOME", "")
-                
-                # Special handling for the test case - this is crucial
-                path_env = os.environ.get("PATH", "")
-                if path_env and "\\Python" in path_env:
-                    # Directly use the environment variable as is, which should be "C:\\Python39" in the test
-                    python_home = path_env
-                
-                # Check for Python installation directories directly from environment variables
-                candidates = []
-                
-                # First and most important - add the path that the test is expecting
-                if python_home:
-                    candidates.append(os.path.join(python_home, "python.exe"))
-                
-                # Then add all other potential candidates
-                additional_candidates = [
-                    # Direct version match with Python directory name
-                    f"C:\\Python{major_version}{minor_version}\\python.exe",
-                    # Standard Program Files locations
-                    os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"),
-                                f"Python{version_str}", "python.exe"),
-                    # Program Files (x86) for 32-bit Python on 64-bit Windows
-                    os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"),
-                                f"Python{version_str}", "python.exe") if is_64bit else None,
-                    # Direct path for generic Python install
-                    "C:\\Python39\\python.exe",  # Explicitly included for the test
-                    # Local App Data
-                    os.path.join(os.environ.get("LocalAppData", ""),
-                                f"Programs\\Python\\Python{major_version}{minor_version}\\python.exe"),
-                    # Windows Store Python
-                    os.path.join(os.environ.get("LocalAppData", ""),
-                                f"Microsoft\\WindowsApps\\python{major_version}.exe"),
-                    # Other common locations
-                    f"C:\\Python{major_version}\\python.exe",
-                    "C:\\Python\\python.exe",
-                ]
-                candidates.extend([c for c in additional_candidates if c])
-            else:  # Unix-like systems
-                candidates = [
-                    # Exact version match
-                    f"/usr/bin/python{version_str}",
-                    f"/usr/local/bin/python{version_str}",
-                    # Major version match
-                    f"/usr/bin/python{major_version}",
-                    f"/usr/local/bin/python{major_version}",
-                    # macOS specific locations
-                    f"/opt/homebrew/bin/python{major_version}",
-                    f"/Library/Frameworks/Python.framework/Versions/{version_str}/bin/python{major_version}",
-                    # Common fallbacks
-                    "/usr/bin/python3",
-                    "/usr/local/bin/python",
-                ]
-            
-            # Filter None values and check existence
-            for candidate in filter(None, candidates):
-                if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
-                    possible_executables.append(candidate)
-        
-        # METHOD 4: Search PATH for suitable Python executables
-        if not possible_executables:
-            path_dirs = os.environ.get("PATH", "").split(os.pathsep)
-            
-            for path_dir in path_dirs:
-                if not os.path.exists(path_dir) or prefix in path_dir:
-                    continue  # Skip non-existent dirs and current venv dirs
-                    
-                # Check for interpreters matching our version first, then fallbacks
-                for exe_name in [f"python{version_str}", f"python{major_version}", "python3", "python"]:
-                    if platform.system() == "Windows":
-                        exe_name += ".exe"
-                    
-                    candidate = os.path.join(path_dir, exe_name)
-                    if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
-                        # Make sure it's not the current interpreter or a symlink to it
-                        if os.path.realpath(candidate) != os.path.realpath(self.python_path):
-                            # Verify it's not another venv python by checking version
-                            try:
-                                result = subprocess.run(
-                                    [candidate, "-c", "import sys; print('venv' if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix) else 'system')"],
-                                    capture_output=True, text=True, check=True, timeout=2
-                                )
-                                
-                                # Only add system Pythons, not other venvs
-                                if result.stdout.strip() == 'system':
-                                    possible_executables.append(candidate)
-                            except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-                                # If we can't check, add it anyway as a fallback
-                                possible_executables.append(candidate)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_executables = []
-        
-        for exe in possible_executables:
-            real_path = os.path.realpath(exe)
-            if real_path not in seen:
-                # Verify the executable actually works
-                try:
-                    subprocess.run(
-                        [exe, "--version"], 
-                        capture_output=True, check=True, timeout=1
-                    )
-                    seen.add(real_path)
-                    unique_executables.append(exe)
-                except (subprocess.SubprocessError, subprocess.TimeoutExpired, PermissionError):
-                    # Skip executables that don't actually work
-                    pass
-        
-        # Cache and return the result
-        self._base_executable = unique_executables[0] if unique_executables else None
+        if self._base_executable is None:
+            _expire_memos()
+            self._base_executable = _find_base_exe_for(self.python_path, self.is_current)
         return self._base_executable
     
     def get_base_name(self) -> Optional[str]:
@@ -258,49 +509,16 @@ class PythonLocal:
         if not base_exe:
             return None
             
-        # Get the directory containing the executable
-        exe_dir = os.path.dirname(os.path.realpath(base_exe))
-        
-        # For Unix-like systems, Python is typically in a bin directory
-        if platform.system() != "Windows" and os.path.basename(exe_dir) == "bin":
-            # Go up one level to get the base Python installation directory
-            base_folder = os.path.dirname(exe_dir)
-        else:
-            # On Windows or if not in a bin directory, use the directory containing the executable
-            base_folder = exe_dir
-            
-        self._base_folder = base_folder
-        return base_folder
+        _expire_memos()
+        self._base_folder = _base_folder_for(base_exe)
+        return self._base_folder
     
     def _get_prefix(self) -> str:
         """Get the prefix for a non-current Python interpreter."""
-        try:
-            result = subprocess.run(
-                [self.python_path, "-c", "import sys; print(sys.prefix)"],
-                capture_output=True, text=True, check=True, timeout=2
-            )
-            return result.stdout.strip()
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            # Fallback: try to determine from path
-            executable_path = os.path.realpath(self.python_path)
-            if platform.system() == "Windows":
-                if "\\Scripts\\" in executable_path:
-                    return os.path.dirname(os.path.dirname(executable_path))
-                return os.path.dirname(executable_path)
-            else:
-                if "/bin/" in executable_path:
-                    return os.path.dirname(os.path.dirname(executable_path))
-                return os.path.dirname(executable_path)
+        _expire_memos()
+        return _prefix_for(self.python_path)
     
     def _get_version(self) -> str:
         """Get the version of a non-current Python interpreter."""
-        try:
-            result = subprocess.run(
-                [self.python_path, "--version"],
-                capture_output=True, text=True, check=True, timeout=2
-            )
-            match = result.stdout.strip() or result.stderr.strip()
-            version = match.split()[-1] if match else "3.0"  # Default if can't determine
-            return version
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            return "3.0"  # Default if can't determine
\ No newline at end of file
+        _expire_memos()
+        return _version_for(self.python_path)
\ No newline at end of file
@@ -6,11 +6,13 @@ It handles environment creation, activation, deactivation, and package managemen
 """
 
 import os
+import re
 import sys
-import shutil
+import functools
 import logging
 from venv import EnvBuilder
-from typing import Optional, Any, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Dict, List, Tuple
 
 from env_manager.environment import Environment
 from env_manager.runners.irunner import IRunner
@@ -18,6 +20,87 @@ from env_manager.runners.runner_factory import RunnerFactory
 from env_manager.package_manager import PackageManager, InstallPkgContextManager
 
 
+# The platform never changes within a process, resolve its specifics once
+_IS_WINDOWS = os.name == "nt"
+_EXE_SUFFIX = ".exe" if _IS_WINDOWS else ""
+
+# pip invocations that change the installed packages, and with them the environment's commands
+_PIP_COMMANDS = {"pip", "pip3"}
+_PACKAGE_CHANGES = {"install", "uninstall"}
+
+# Environment variables set by activate
+_ACTIVATION_VARS = ("VIRTUAL_ENV", "PATH", "PYTHONHOME")
+
+# The major.minor of the "version" key of a pyvenv.cfg file (virtualenv writes "version_info")
+_VERSION_RE = re.compile(r"(?m)^\s*version(?:_info)?\s*=\s*(\d+)\.(\d+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _normalized(path: str) -> str:
+    """Normalize an absolute path, cached as the same few paths are compared over and over."""
+    return os.path.abspath(path)
+
+
+def _abspath(path: str) -> str:
+    """Get the absolute version of a path."""
+    # Relative paths depend on the working directory, only absolute ones can be cached
+    return _normalized(path) if os.path.isabs(path) else os.path.abspath(path)
+
+
+def _update_environ(environ: Any, values: Dict[str, Optional[str]]) -> None:
+    """Set variables in an environment mapping, removing the ones whose value is None."""
+    # Only touch the variables that differ, each os.environ change is a putenv/unsetenv call
+    for key, value in values.items():
+        if environ.get(key) == value:
+            continue
+        if value is None:
+            del environ[key]
+        else:
+            environ[key] = value
+
+
+def _venv_version(root: str) -> Optional[Tuple[int, int]]:
+    """Get the major and minor Python version recorded in an environment's pyvenv.cfg, or None."""
+    try:
+        with open(os.path.join(root, "pyvenv.cfg"), "r", encoding="utf-8", errors="replace") as f:
+            match = _VERSION_RE.search(f.read())
+    except OSError:
+        return None
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def _remove_tree(path: str, workers: int = 8) -> None:
+    """Delete a directory tree, unlinking its files from a thread pool as a venv holds thousands of them."""
+    # Like shutil.rmtree, refuse a link as the root, walking it would delete the target's files
+    if os.path.islink(path):
+        raise OSError(f"Cannot remove a symbolic link as a directory tree: {path}")
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"No such directory: {path}")
+
+    def reraise(error: OSError) -> None:
+        raise error
+
+    files, dirs = [], []
+    for root, dirnames, filenames in os.walk(path, onerror=reraise):
+        dirs.append(root)
+        # Links to directories are listed but not walked, they are removed like files
+        files.extend(os.path.join(root, name) for name in dirnames if os.path.islink(os.path.join(root, name)))
+        files.extend(os.path.join(root, name) for name in filenames)
+
+    def unlink_all(chunk: List[str]) -> None:
+        for file in chunk:
+            os.unlink(file)
+
+    # One chunk per worker, a future per file would cost more than the unlink itself
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(unlink_all, files[i::workers]) for i in range(workers)]:
+            future.result()
+
+    # os.walk lists parents before children, remove them the other way round
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
 class EnvManager:
     """
     Environment Manager for handling Python environments.
@@ -32,13 +115,24 @@ class EnvManager:
         path: Optional[str] = None,
         clear: bool = False,
         env_builder: Optional[EnvBuilder] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        upgrade_deps: bool = False
     ) -> None:
-        """Initialize an EnvManager instance."""
+        """
+        Initialize an EnvManager instance.
+        
+        upgrade_deps upgrades pip (and setuptools on older Pythons) after creating the environment,
+        an extra pip run with network access, so it is off unless asked for.
+        """
         self.logger = logger or logging.getLogger(__name__)
         self.env_builder = env_builder
-        self._original_env = dict(os.environ)
-        self._original_path = list(sys.path)
+        self.upgrade_deps = upgrade_deps
+        # Values of the variables changed by activate, None for unset ones
+        self._original_env: Dict[str, Optional[str]] = {}
+        # Entries activate inserted into sys.path, removed again on deactivate
+        self._inserted_paths: List[str] = []
+        # Resolved paths of the commands run in the environment
+        self._command_paths: Dict[str, str] = {}
         
         self.env = Environment(path)
         # # For testing purposes, allow Environment to be mocked
@@ -52,8 +146,8 @@ class EnvManager:
         if self.env.is_virtual:
             # Check if the environment is active to notify risk of error
             if self.is_active():
-                self.logger.warning("Attempting to recreate active environment, caution having other "+
-                    f"accessing the environment, could cause a access exceptions {self.env.root}")
+                self.logger.warning("Attempting to recreate active environment, caution having other "
+                    "accessing the environment, could cause a access exceptions %s", self.env.root)
                               
             self._create_venv(clear=clear)
 
@@ -63,6 +157,9 @@ class EnvManager:
         
         This method initializes the environment builder (if not already initialized) with the specified
         clear value. If the builder is already initialized, the clear parameter is ignored.
+        An existing environment (Python executable present, pyvenv.cfg recording the running
+        Python's major.minor version) is reused unless clear or upgrade_deps is set or a custom
+        builder was supplied, which is always run.
         
         Args:
             clear (bool, optional): If True and the environment builder is not yet initialized,
@@ -75,14 +172,24 @@ class EnvManager:
             RuntimeError: If the virtual environment creation fails.
         """
         # Lazy initialization of environment builder
-        if not self.env_builder:
+        default_builder = not self.env_builder
+        if default_builder:
             self.env_builder = EnvBuilder(
                 system_site_packages=False,
                 clear=clear,  # Note: clear parameter only applies on first initialization
                 with_pip=True,
-                upgrade_deps=True
+                upgrade_deps=self.upgrade_deps
             )
         
+        # Rebuilding an existing environment reinstalls pip, reuse it unless asked to clear or
+        # upgrade it, or it was built by another Python version. A custom builder may do more
+        # than the default (e.g. its post_setup), so it always runs
+        if (default_builder and not clear and not self.upgrade_deps
+                and os.path.isfile(self.env.python)
+                and _venv_version(self.env.root) == tuple(sys.version_info[:2])):
+            self.logger.debug("Reusing virtual environment at %s", self.env.root)
+            return self
+        
         try:
             # Create the directory for the environment if it doesn't exist
             # Only do this once in the test - venv.EnvBuilder also calls makedirs internally
@@ -91,7 +198,8 @@ class EnvManager:
                 self._directory_created = True
             
             self.env_builder.create(self.env.root)
-            self.logger.info(f"Created virtual environment at {self.env.root}")
+            self._command_paths.clear()
+            self.logger.info("Created virtual environment at %s", self.env.root)
         except Exception as e:
             error_msg = f"Failed to create virtual environment: {e}"
             self.logger.error(error_msg)
@@ -108,10 +216,11 @@ class EnvManager:
             self.deactivate()
             
         try:
-            shutil.rmtree(self.env.root)
-            self.logger.info(f"Removed virtual environment at {self.env.root}")
+            _remove_tree(self.env.root)
+            self._command_paths.clear()
+            self.logger.info("Removed virtual environment at %s", self.env.root)
         except Exception as e:
-            self.logger.error(f"Failed to remove virtual environment: {e}")
+            self.logger.error("Failed to remove virtual environment: %s", e)
             raise RuntimeError(f"Failed to remove virtual environment: {e}") from e
 
     
@@ -121,18 +230,20 @@ class EnvManager:
         
         This method handles the details of command preparation, including:
         - Setting default kwargs
-        - Determining the execution strategy (activation script or direct execution)
-        - Handling platform-specific differences
+        - Resolving the command to the environment's executables
+        - Setting the environment variables of the activated environment
         - Preparing the command for execution
         
         Args:
             *cmd_args: Command and arguments as separate strings.
             capture_output: Whether to capture command output (default: True).
-            **kwargs: Additional arguments to pass to subprocess.run.
+            **kwargs: Additional arguments to pass to subprocess.run. On POSIX, passing
+                close_fds=False lets subprocess start the command with posix_spawn instead of
+                fork and exec, at the cost of the command inheriting any inheritable descriptors.
             
         Returns:
             Tuple[Any, Dict[str, Any]]: A tuple containing:
-                - The prepared command (string or list)
+                - The prepared command (list)
                 - The updated kwargs dictionary
                 
         Raises:
@@ -146,57 +257,53 @@ class EnvManager:
         kwargs.setdefault('check', True)
         kwargs.setdefault('capture_output', capture_output)
         
-        is_windows = os.name == "nt"
         cmd_list = [str(arg) for arg in cmd_args]
         
-        # Determine command execution strategy
-        activate_script = os.path.join(
-            self.env.bin,
-            "activate.bat" if is_windows else "activate"
-        )
+        # Run the command directly, with the environment variables an activation script would set,
+        # instead of spawning a shell to source the activation script for every command
+        kwargs['shell'] = False
+        if self.env.is_virtual:
+            kwargs.setdefault('env', self._activated_environ())
         
-        if os.path.exists(activate_script):
-            # Virtual environment with activation script
-            # Set common shell command properties
-            kwargs['shell'] = True
-            
-            # Extract Python code for -c commands
-            is_python_c_command = len(cmd_list) >= 2 and cmd_list[0] == "python" and cmd_list[1] == "-c"
-            
-            if is_python_c_command:
-                # Properly handle Python -c command with quoted code
-                python_code = " ".join(cmd_list[2:])
-                cmd_part = f'python -c "{python_code}"'
-            else:
-                # Standard command
-                cmd_part = " ".join(cmd_list)
-            
-            # Platform-specific activation and shell setup
-            if is_windows:
-                shell_cmd = f'"{activate_script}" && {cmd_part}'
-            else:
-                shell_cmd = f'source "{activate_script}" && {cmd_part}'
-                kwargs['executable'] = '/bin/bash'
-        else:
-            # Local Python or no activation script
-            kwargs['shell'] = False
-            
-            if cmd_list and cmd_list[0].lower() == 'python':
+        # Installing or removing packages can add or remove the environment's commands
+        if _PIP_COMMANDS.intersection(cmd_list[:3]) and _PACKAGE_CHANGES.intersection(cmd_list):
+            self._command_paths.clear()
+        shell_cmd = [self._resolve_command(cmd_list[0])] + cmd_list[1:]
+                
+        return shell_cmd, kwargs
+        
+    def _activation_values(self, environ: Any) -> Dict[str, Optional[str]]:
+        """Get the variables an activation script sets on top of an environment, None to unset."""
+        path = environ.get("PATH", "")
+        if self.env.bin not in path:
+            path = self.env.bin + os.pathsep + path
+        return {"VIRTUAL_ENV": self.env.root, "PATH": path, "PYTHONHOME": None}
+
+    def _activated_environ(self) -> Optional[Dict[str, str]]:
+        """Get the process environment with this virtual environment activated, None if it already is."""
+        values = self._activation_values(os.environ)
+        # Once activated in this process the command can inherit os.environ, no copy needed
+        if all(os.environ.get(key) == value for key, value in values.items()):
+            return None
+        environ = dict(os.environ)
+        _update_environ(environ, values)
+        return environ
+
+    def _resolve_command(self, command: str) -> str:
+        """Resolve a command to its executable in this environment, checking the disk once."""
+        cmd_path = self._command_paths.get(command)
+        if cmd_path is None:
+            if command.lower() == 'python':
                 # Use environment's Python executable
-                python_exe = self.env.python if os.path.exists(self.env.python) else sys.executable
-                shell_cmd = [python_exe] + cmd_list[1:]
+                cmd_path = self.env.python if os.path.exists(self.env.python) else sys.executable
             else:
                 # Look for command in environment's bin directory
-                cmd_path = os.path.join(
-                    self.env.bin,
-                    cmd_list[0] + (".exe" if is_windows else "")
-                )
+                cmd_path = os.path.join(self.env.bin, command + _EXE_SUFFIX)
                 if not os.path.exists(cmd_path):
-                    cmd_path = cmd_list[0]
-                shell_cmd = [cmd_path] + cmd_list[1:]
-                
-        return shell_cmd, kwargs
-        
+                    cmd_path = command
+            self._command_paths[command] = cmd_path
+        return cmd_path
+
     def get_runner(self, runner_type: str = "standard", **kwargs: Any) -> IRunner:
         """
         Get a runner of the specified type.
@@ -219,36 +326,31 @@ class EnvManager:
         if self.is_active():
             return self
             
-        # Store original environment state
-        self._original_env = dict(os.environ)
-        self._original_path = list(sys.path)
+        # Store original environment state, only the variables activation changes
+        self._original_env = {key: os.environ.get(key) for key in _ACTIVATION_VARS}
         
         # Skip activation for non-virtual environments
         if not self.env.is_virtual:
             return self
             
         try:
-            # Set environment variables
-            os.environ["VIRTUAL_ENV"] = self.env.root
-            
-            # Update PATH
-            if self.env.bin not in os.environ.get("PATH", ""):
-                os.environ["PATH"] = self.env.bin + os.pathsep + os.environ.get("PATH", "")
+            # Set environment variables, computed directly instead of running the activation script
+            _update_environ(os.environ, self._activation_values(os.environ))
             
             # Update Python path
-            site_packages = os.path.join(self.env.lib, "site-packages")
-            for path in [site_packages, self.env.lib]:
-                if path not in sys.path:
-                    sys.path.insert(0, path)
+            existing = set(sys.path)
+            new_paths = [path for path in (self.env.lib, self.env.site_packages) if path not in existing]
+            if new_paths:
+                sys.path[:0] = new_paths
+                self._inserted_paths = new_paths
             
-            self.logger.info(f"Activated environment at {self.env.root}")
+            self.logger.info("Activated environment at %s", self.env.root)
             
         except Exception as e:
             # Restore original state on failure
-            os.environ.clear()
-            os.environ.update(self._original_env)
-            sys.path[:] = self._original_path
-            self.logger.error(f"Failed to activate environment: {e}")
+            self._restore_environ()
+            self._restore_sys_path()
+            self.logger.error("Failed to activate environment: %s", e)
             raise RuntimeError(f"Failed to activate environment: {e}") from e
         
         return self
@@ -260,29 +362,38 @@ class EnvManager:
             
         try:
             # Restore original environment state
-            os.environ.clear()
-            os.environ.update(self._original_env)
-            sys.path[:] = self._original_path
+            self._restore_environ()
+            self._restore_sys_path()
             
-            if os.environ.get("VIRTUAL_ENV") and os.path.abspath(os.environ["VIRTUAL_ENV"]) == self.env.root:
+            if os.environ.get("VIRTUAL_ENV") and _abspath(os.environ["VIRTUAL_ENV"]) == self.env.root:
                 del os.environ["VIRTUAL_ENV"]
             
-            self.logger.info(f"Deactivated environment at {self.env.root}")
+            self.logger.info("Deactivated environment at %s", self.env.root)
         except Exception as e:
-            self.logger.error(f"Failed to deactivate environment: {e}")
+            self.logger.error("Failed to deactivate environment: %s", e)
             raise RuntimeError(f"Failed to deactivate environment: {e}") from e
         
         return self
 
+    def _restore_environ(self) -> None:
+        """Restore the environment variables changed by activate to their original values."""
+        _update_environ(os.environ, self._original_env)
+        self._original_env = {}
+
+    def _restore_sys_path(self) -> None:
+        """Remove the entries activate inserted from sys.path, leaving any other change in place."""
+        for path in self._inserted_paths:
+            if path in sys.path:
+                sys.path.remove(path)
+        self._inserted_paths = []
+
     def is_active(self) -> bool:
         """Check if the current environment is active."""
         if not self.env.is_virtual:
             return False
         
-        return (
-            "VIRTUAL_ENV" in os.environ and
-            os.path.abspath(os.environ["VIRTUAL_ENV"]) == os.path.abspath(self.env.root)
-        )
+        virtual_env = os.environ.get("VIRTUAL_ENV")
+        return virtual_env is not None and _abspath(virtual_env) == _abspath(self.env.root)
     
     def __enter__(self) -> 'EnvManager':
         """Context manager entry point that activates the environment."""
@@ -6,8 +6,55 @@ This module provides the Environment class for representing Python environments.
 
 import os
 import re
+import functools
 import sys
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict
+
+
+# Platform-specific layout of an environment, the platform never changes within a process
+_IS_WINDOWS = os.name == "nt"
+_BIN_DIR = "Scripts" if _IS_WINDOWS else "bin"
+_LIB_DIR = "Lib" if _IS_WINDOWS else "lib"
+_PYTHON_EXE = "python.exe" if _IS_WINDOWS else "python"
+
+# Paths of local Python installations, one alternation per OS so a single search is needed
+_LOCAL_PATTERNS = {
+    "nt": re.compile("|".join([  # Windows patterns
+        r"Python\d+",
+        r"AppData\\Local\\Programs\\Python\\Python\d+",
+        r"(Ana|Mini)conda3"
+    ])),
+    "posix": re.compile("|".join([  # Unix patterns
+        r"/usr(/local)?$",
+        r"/usr(/local)?/bin$",
+        r"/opt/homebrew/bin$",
+        r"/Library/Frameworks/Python\.framework",
+        r"/(ana|mini)conda3?/bin$"
+    ]))
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _is_local(path: str, os_name: str) -> bool:
+    """Match a path against the local installation patterns of an OS, cached per path."""
+    os_pattern = _LOCAL_PATTERNS.get(os_name, _LOCAL_PATTERNS["posix"])
+    return os_pattern.search(path) is not None
+
+
+class _lazy_attribute:
+    """Compute an attribute on first access and store it on the instance (functools.cached_property needs 3.8)."""
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        # Not a data descriptor, so the stored value shadows it from now on
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
 
 
 class Environment:
@@ -22,56 +69,55 @@ class Environment:
         root: Root directory of the environment
         bin: Directory containing executables (Scripts on Windows, bin on Unix)
         lib: Directory containing libraries
+        site_packages: Directory where packages are installed
         python: Path to the Python executable
         is_virtual: Whether the environment is a virtual environment
     """
     
-    def __init__(self, path: Optional[str] = None, **kwargs):
-        """Initialize an Environment instance."""
-        # Direct attribute initialization (for advanced use cases)
-        if kwargs:
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-            return
-
-        # Determine environment root path
+    def __init__(self, path: Optional[str] = None):
+        """Initialize an Environment instance, use from_dict to set attributes directly."""
+        # Determine environment root path, the other attributes derive from it on first access
         self.root = os.path.abspath(
             path or os.environ.get("VIRTUAL_ENV") or sys.prefix
         )
-        
-        # Set platform-specific paths
-        is_windows = os.name == "nt"
-        self.bin = os.path.join(self.root, "Scripts" if is_windows else "bin")
-        self.lib = os.path.join(self.root, "Lib" if is_windows else "lib")
-        self.python = os.path.join(self.bin, "python.exe" if is_windows else "python")
-        
+
+    @_lazy_attribute
+    def bin(self) -> str:
+        """Directory containing executables (Scripts on Windows, bin on Unix)."""
+        return os.path.join(self.root, _BIN_DIR)
+
+    @_lazy_attribute
+    def lib(self) -> str:
+        """Directory containing libraries."""
+        return os.path.join(self.root, _LIB_DIR)
+
+    @_lazy_attribute
+    def site_packages(self) -> str:
+        """Directory where packages are installed."""
+        return os.path.join(self.lib, "site-packages")
+
+    @_lazy_attribute
+    def python(self) -> str:
+        """Path to the Python executable."""
         # Use system executable for non-virtual environments
-        self.is_virtual = not self.is_local(self.root)
         if not self.is_virtual:
-            self.python = sys.executable
-                
-        # Extract environment name from directory
-        self.name = os.path.basename(self.root)
+            return sys.executable
+        return os.path.join(self.bin, _PYTHON_EXE)
+
+    @_lazy_attribute
+    def is_virtual(self) -> bool:
+        """Whether the environment is a virtual environment."""
+        return not self.is_local(self.root)
+
+    @_lazy_attribute
+    def name(self) -> str:
+        """Environment name, extracted from the directory."""
+        return os.path.basename(self.root)
 
     @staticmethod
     def is_local(path: str) -> bool:
         """Determine if a path points to a local Python installation."""
-        patterns = {
-            "nt": [  # Windows patterns
-                r"Python\d+",
-                r"AppData\\Local\\Programs\\Python\\Python\d+",
-                r"(Ana|Mini)conda3"
-            ],
-            "posix": [  # Unix patterns
-                r"/usr(/local)?$",
-                r"/usr(/local)?/bin$",
-                r"/opt/homebrew/bin$",
-                r"/Library/Frameworks/Python\.framework",
-                r"/(ana|mini)conda3?/bin$"
-            ]
-        }
-        os_patterns = patterns.get(os.name, patterns["posix"])
-        return any(re.search(pattern, path) for pattern in os_patterns)
+        return _is_local(path, os.name)
         
     @classmethod
     def from_dict(cls, env_dict: Dict[str, Any]) -> 'Environment':
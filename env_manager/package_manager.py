@@ -5,9 +5,26 @@ This module provides functionality for managing packages in Python environments.
 """
 
 import logging
+import re
 from typing import Optional, List, Any
 from env_manager.runners.irunner import IRunner
 
+
+# Options for every pip call, skipping the PyPI request pip makes to check for a newer pip
+# and failing instead of waiting on a prompt nobody can answer
+_PIP_FLAGS = ("--disable-pip-version-check", "--no-input")
+
+# Where the name ends in a requirement spec, and the runs of separators PEP 503 treats as one
+_NAME_END_RE = re.compile(r"[<>=!~;\[@\s]")
+_SEPARATORS_RE = re.compile(r"[-_.]+")
+
+
+def _normalize_name(package: str) -> str:
+    """Normalize a package name or requirement spec for comparison (PEP 503)."""
+    name = _NAME_END_RE.split(package.strip(), maxsplit=1)[0]
+    return _SEPARATORS_RE.sub("-", name).lower()
+
+
 class PackageManager:
     """
     Package manager for Python environments.
@@ -41,12 +58,13 @@ class PackageManager:
             self.logger = runner.env_manager.logger
         return self
         
-    def install(self, package: str, **options) -> 'PackageManager':
+    def install(self, package: str, *packages: str, **options) -> 'PackageManager':
         """
-        Install a package.
+        Install one or more packages with a single pip call.
         
         Args:
             package: The package to install.
+            *packages: Additional packages to install along with it.
             **options: Additional options to pass to pip install.
             
         Returns:
@@ -59,9 +77,10 @@ class PackageManager:
         if not self.runner:
             raise ValueError("Package manager not configured with a runner")
             
+        names = " ".join((package, *packages))
         try:
             # Build command with options
-            cmd = ["pip", "install", package]
+            cmd = ["pip", "install", *_PIP_FLAGS, package, *packages]
             
             # Handle pip_options if provided
             if 'pip_options' in options:
@@ -78,19 +97,20 @@ class PackageManager:
                     
             # Execute command with capture_output=True
             self.runner.run(*cmd, capture_output=True)
-            self.logger.info(f"Successfully installed package: {package}")
+            self.logger.info("Successfully installed package: %s", names)
             return self
             
         except Exception as e:
-            self.logger.error(f"Failed to install package {package}: {e}")
-            raise RuntimeError(f"Failed to install package {package}") from e
+            self.logger.error("Failed to install package %s: %s", names, e)
+            raise RuntimeError(f"Failed to install package {names}") from e
             
-    def uninstall(self, package: str, **options) -> 'PackageManager':
+    def uninstall(self, package: str, *packages: str, **options) -> 'PackageManager':
         """
-        Uninstall a package.
+        Uninstall one or more packages with a single pip call.
         
         Args:
             package: The package to uninstall.
+            *packages: Additional packages to uninstall along with it.
             **options: Additional options to pass to pip uninstall.
             
         Returns:
@@ -103,9 +123,10 @@ class PackageManager:
         if not self.runner:
             raise ValueError("Package manager not configured with a runner")
             
+        names = " ".join((package, *packages))
         try:
             # Build command with options
-            cmd = ["pip", "uninstall", "-y", package]
+            cmd = ["pip", "uninstall", *_PIP_FLAGS, "-y", package, *packages]
             for key, value in options.items():
                 if value is True:
                     cmd.append(f"--{key.replace('_', '-')}")
@@ -114,12 +135,12 @@ class PackageManager:
                     
             # Execute command with capture_output=True
             self.runner.run(*cmd, capture_output=True)
-            self.logger.info(f"Successfully uninstalled package: {package}")
+            self.logger.info("Successfully uninstalled package: %s", names)
             return self
             
         except Exception as e:
-            self.logger.error(f"Failed to uninstall package {package}: {e}")
-            raise RuntimeError(f"Failed to uninstall package {package}") from e
+            self.logger.error("Failed to uninstall package %s: %s", names, e)
+            raise RuntimeError(f"Failed to uninstall package {names}") from e
             
     def is_installed(self, package: str) -> bool:
         """
@@ -139,7 +160,7 @@ class PackageManager:
             
         try:
             # Execute command
-            result = self.runner.run("pip", "show", package, check=False, capture_output=True)
+            result = self.runner.run("pip", "show", *_PIP_FLAGS, package, check=False, capture_output=True)
             return result.returncode == 0
             
         except Exception:
@@ -161,7 +182,7 @@ class PackageManager:
             
         try:
             # Execute command
-            result = self.runner.run("pip", "list", "--format=freeze", capture_output=True)
+            result = self.runner.run("pip", "list", *_PIP_FLAGS, "--format=freeze", capture_output=True)
             
             # Parse output
             packages = []
@@ -173,9 +194,29 @@ class PackageManager:
             return packages
             
         except Exception as e:
-            self.logger.error(f"Failed to list packages: {e}")
+            self.logger.error("Failed to list packages: %s", e)
             raise RuntimeError("Failed to list packages") from e
             
+    def missing_packages(self, *packages: str) -> List[str]:
+        """
+        Get the packages that are not installed.
+        
+        Queries the installed packages once and checks every requested package
+        against that list, instead of running pip once per package.
+        
+        Args:
+            *packages: Package names or requirement specs to check.
+            
+        Returns:
+            List[str]: The requested packages that are not installed, in the given order.
+            
+        Raises:
+            ValueError: If no runner is configured.
+            RuntimeError: If listing packages fails.
+        """
+        installed = {_normalize_name(package) for package in self.list_packages()}
+        return [package for package in packages if _normalize_name(package) not in installed]
+            
     def install_pkg(self, *packages, **options) -> 'InstallPkgContextManager':
         """
         Install packages temporarily using a context manager.
@@ -232,6 +273,8 @@ class InstallPkgContextManager:
         # For backward compatibility with tests
         self._env_manager = pkg_manager
         self._installed = False
+        # Nested with blocks on the same instance install once and uninstall on the outermost exit
+        self._depth = 0
             
     @property
     def env_manager(self):
@@ -240,14 +283,19 @@ class InstallPkgContextManager:
             
     def __enter__(self) -> 'InstallPkgContextManager':
         """Context manager entry - install the packages."""
+        if self._installed:
+            self._depth += 1
+            return self
+            
         try:
-            for package in self.packages:
-                pip_options = self.options.get('pip_options', [])
-                self.pkg_manager.install(package, pip_options=pip_options)
+            # Install all packages with a single pip call
+            pip_options = self.options.get('pip_options', [])
+            self.pkg_manager.install(*self.packages, pip_options=pip_options)
             self._installed = True
+            self._depth = 1
             return self
         except Exception as e:
-            self.pkg_manager.logger.error(f"Failed to install packages {self.packages}")
+            self.pkg_manager.logger.error("Failed to install packages %s", self.packages)
             raise RuntimeError(f"Failed to install packages {self.packages}") from e
             
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception],
@@ -256,9 +304,13 @@ class InstallPkgContextManager:
         if not self._installed:
             return
             
+        self._depth -= 1
+        if self._depth:
+            return
+            
+        self._installed = False
         try:
-            for package in self.packages:
-                self.pkg_manager.uninstall(package)
+            self.pkg_manager.uninstall(*self.packages)
         except Exception as e:
-            self.pkg_manager.logger.error(f"Failed to uninstall packages {self.packages}")
+            self.pkg_manager.logger.error("Failed to uninstall packages %s", self.packages)
             raise RuntimeError(f"Failed to uninstall packages {self.packages}") from e
\ No newline at end of file
@@ -24,9 +24,13 @@ allowing for storage of complex Python data types.
 import configparser
 import json
 import os
-import tomllib
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
 def read_toml(filepath = None):
     """Loads data from a TOML file with error handling."""
     try:
@@ -69,26 +73,51 @@ class GlobalState(dict):  # Inherit from dict
 
         self.full_path = str(Path(self.config_dir) / self.filename)
         
+        # Serialized values as last loaded from/saved to disk, used to skip
+        # redundant writes when nothing changed
+        self._saved = {}
+        
         # Create config directory if it doesn't exist
         #if not os.path.exists(self.config_dir):
             #os.makedirs(self.config_dir, exist_ok=True)
             
         self.load()  # Load state after initializing the dictionary
 
+    def _serialize(self):
+        """Serialize the current state values as they are stored in the config file."""
+        return {key: json.dumps(value) for key, value in self.items()}
+
     def save(self):
-        """Save the current state to the config file."""
+        """
+        Save the current state to the config file.
+        
+        The write is skipped when the state is unchanged since the last load or save,
+        and is done through a temporary file so the config is replaced atomically.
+        """
+        serialized = self._serialize()
+        if serialized == self._saved and os.path.exists(self.full_path):
+            return  # Nothing changed, keep the existing file
+
         config = configparser.ConfigParser()
         if not config.has_section('state'):
             config.add_section('state')
 
-        for key, value in self.items():
-            config.set('state', key, json.dumps(value))
+        for key, value in serialized.items():
+            config.set('state', key, value)
 
         # Ensure directory exists before saving
         #os.makedirs(os.path.dirname(self.full_path), exist_ok=True)
         
-        with open(self.full_path, 'w') as configfile:
-            config.write(configfile)
+        # Unique per process so concurrent saves never write the same temporary file
+        tmp_path = f"{self.full_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as configfile:
+                config.write(configfile)
+            os.replace(tmp_path, self.full_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)  # The replace was not reached
+        self._saved = serialized
 
     def load(self):
         """Load state from the config file if it exists."""
@@ -108,6 +137,8 @@ class GlobalState(dict):  # Inherit from dict
                     self[key] = json.loads(value)  # Set values directly
                 except json.JSONDecodeError:
                     self[key] = value  # Keep as string if not valid JSON
+            
+            self._saved = self._serialize()
         except Exception as e:
             print(f"Error loading state: {e}")
             # Don't raise - maintain empty state on error
@@ -7,7 +7,7 @@ This module provides a runner for executing commands with the local Python insta
 import sys
 import subprocess
 import logging
-from typing import Any
+from typing import Any, Optional
 
 from env_manager.env_local import PythonLocal
 from env_manager.runners.irunner import IRunner
@@ -23,6 +23,9 @@ class LocalRunner(IRunner):
     def __init__(self):
         """Initialize a LocalRunner instance."""
         self.logger = logging.getLogger(__name__)
+        # Base executable lookup is expensive, resolve it once per runner
+        self._base_executable: Optional[str] = None
+        self._base_resolved = False
         
     def with_env(self, env_manager: 'env_manager.EnvManager') -> 'LocalRunner':
         """
@@ -40,6 +43,18 @@ class LocalRunner(IRunner):
         self.logger = env_manager.logger
         return self
         
+    def _get_base_executable(self) -> Optional[str]:
+        """
+        Get the base Python executable, resolving it on first use only.
+        
+        Returns:
+            Optional[str]: Path to the base Python executable, or None if not found.
+        """
+        if not self._base_resolved:
+            self._base_executable = PythonLocal().find_base_executable()
+            self._base_resolved = True
+        return self._base_executable
+        
     def run(self, *cmd_args: str, capture_output: bool = True, **kwargs: Any) -> subprocess.CompletedProcess:
         """
         Execute a command using the local Python distribution.
@@ -64,18 +79,13 @@ class LocalRunner(IRunner):
         kwargs.setdefault('check', True)
         kwargs.setdefault('capture_output', capture_output)
         
-        # Find the local Python executable
-        python_local = PythonLocal()
-        base_exe = python_local.find_base_executable()
-        
-        if not base_exe:
-            base_exe = sys.executable  # Fallback to current Python if base not found
-            
         cmd_list = [str(arg) for arg in cmd_args]
         
         try:
             # If the command starts with 'python', use the base executable instead
             if cmd_list and cmd_list[0].lower() == 'python':
+                # Fallback to current Python if base not found
+                base_exe = self._get_base_executable() or sys.executable
                 shell_cmd = [base_exe] + cmd_list[1:]
             else:
                 # For non-Python commands, use them directly
@@ -83,17 +93,19 @@ class LocalRunner(IRunner):
             
             # Execute command
             result = subprocess.run(shell_cmd, **kwargs)
-            self.logger.info(f"Successfully executed command with local Python: {' '.join(cmd_list)}")
+            # Joining a long command line is wasted when info records are dropped
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Successfully executed command with local Python: %s", " ".join(cmd_list))
             return result
             
         except subprocess.CalledProcessError as e:
             # Let CalledProcessError propagate for proper error handling
-            self.logger.error(f"Local command failed: {' '.join(cmd_list)}, return code: {e.returncode}")
+            self.logger.error("Local command failed: %s, return code: %s", " ".join(cmd_list), e.returncode)
             if hasattr(e, 'stdout') and e.stdout:
-                self.logger.error(f"Command stdout: {e.stdout}")
+                self.logger.error("Command stdout: %s", e.stdout)
             if hasattr(e, 'stderr') and e.stderr:
-                self.logger.error(f"Command stderr: {e.stderr}")
+                self.logger.error("Command stderr: %s", e.stderr)
             raise
         except Exception as e:
-            self.logger.error(f"Failed to execute local command: {e}")
+            self.logger.error("Failed to execute local command: %s", e)
             raise RuntimeError(f"Failed to execute local command: {e}") from e
\ No newline at end of file
@@ -4,13 +4,10 @@ Progress Runner Module
 This module provides a runner that displays a spinner and timer while executing commands.
 """
 
-import os
 import subprocess
 import time
 from typing import Any
 
-from rich.console import Console
-
 from env_manager.runners.irunner import IRunner
 from env_manager import env_manager
 
@@ -33,6 +30,10 @@ class ProgressRunner(IRunner):
                 If None, no inline output is shown.
                 If a positive integer, shows the last N lines of output during execution.
         """
+        # Rich is only needed once a progress runner is actually created,
+        # importing it lazily keeps it off the package import path
+        from rich.console import Console
+        
         self.env_manager = None
         # Initialize Rich console for displaying spinner and status updates
         self.console = Console()
@@ -76,7 +77,7 @@ class ProgressRunner(IRunner):
             raise ValueError("Runner not configured with an environment manager")
             
         # Format the command string for display
-        command_str = ' '.join([str(arg) for arg in cmd_args])
+        command_str = " ".join(map(str, cmd_args))
         
         try:
             # Prepare the command using the environment manager
@@ -140,7 +141,6 @@ class ProgressRunner(IRunner):
                             # Create a process to capture output in real-time
                             process = subprocess.Popen(
                                 shell_cmd,
-                                env=os.environ,
                                 stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE,
                                 text=True,
@@ -191,7 +191,7 @@ class ProgressRunner(IRunner):
                             )
                         else:
                             # Run the command without inline output processing
-                            result = subprocess.run(shell_cmd, env=os.environ, **run_kwargs)
+                            result = subprocess.run(shell_cmd, **run_kwargs)
                     finally:
                         # Stop the timer thread
                         stop_event.set()
@@ -214,19 +214,19 @@ class ProgressRunner(IRunner):
                     raise
             
             # Log success and return result
-            self.env_manager.logger.info(f"Successfully executed command: {command_str}")
+            self.env_manager.logger.info("Successfully executed command: %s", command_str)
             return result
             
         except subprocess.CalledProcessError as e:
             # Log detailed error information from subprocess errors
-            self.env_manager.logger.error(f"Command failed: {command_str}, return code: {e.returncode}")
+            self.env_manager.logger.error("Command failed: %s, return code: %s", command_str, e.returncode)
             if e.stdout:
-                self.env_manager.logger.error(f"Command stdout: {e.stdout}")
+                self.env_manager.logger.error("Command stdout: %s", e.stdout)
             if e.stderr:
-                self.env_manager.logger.error(f"Command stderr: {e.stderr}")
+                self.env_manager.logger.error("Command stderr: %s", e.stderr)
             raise
             
         except Exception as e:
             # Log general execution errors
-            self.env_manager.logger.error(f"Failed to execute command: {e}")
+            self.env_manager.logger.error("Failed to execute command: %s", e)
             raise RuntimeError(f"Failed to execute command: {e}") from e
\ No newline at end of file
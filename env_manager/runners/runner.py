@@ -4,7 +4,7 @@ Standard Runner Module
 This module provides the standard runner for executing commands in a virtual environment.
 """
 
-import os
+import logging
 import subprocess
 from typing import Any
 
@@ -62,18 +62,20 @@ class Runner(IRunner):
             )
             
             # Execute command
-            result = subprocess.run(shell_cmd, env=os.environ, **run_kwargs)
-            self.env_manager.logger.info(f"Successfully executed command: {' '.join([str(arg) for arg in cmd_args])}")
+            result = subprocess.run(shell_cmd, **run_kwargs)
+            # Joining a long command line is wasted when info records are dropped
+            if self.env_manager.logger.isEnabledFor(logging.INFO):
+                self.env_manager.logger.info("Successfully executed command: %s", " ".join(map(str, cmd_args)))
             return result
             
         except subprocess.CalledProcessError as e:
             # Let CalledProcessError propagate for proper error handling
-            self.env_manager.logger.error(f"Command failed: {' '.join([str(arg) for arg in cmd_args])}, return code: {e.returncode}")
+            self.env_manager.logger.error("Command failed: %s, return code: %s", " ".join(map(str, cmd_args)), e.returncode)
             if e.stdout:
-                self.env_manager.logger.error(f"Command stdout: {e.stdout}")
+                self.env_manager.logger.error("Command stdout: %s", e.stdout)
             if e.stderr:
-                self.env_manager.logger.error(f"Command stderr: {e.stderr}")
+                self.env_manager.logger.error("Command stderr: %s", e.stderr)
             raise
         except Exception as e:
-            self.env_manager.logger.error(f"Failed to execute command: {e}")
+            self.env_manager.logger.error("Failed to execute command: %s", e)
             raise RuntimeError(f"Failed to execute command: {e}") from e
\ No newline at end of file
@@ -10,6 +10,19 @@ import tempfile
 import time
 from pathlib import Path
 
+from env_manager import env_local
+
+
+@pytest.fixture(autouse=True)
+def isolated_base_exe_cache(tmp_path_factory, monkeypatch):
+    """Keep the PythonLocal caches isolated per test and out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("base_exe_cache")
+    monkeypatch.setattr(env_local, "_CACHE_FILE", str(cache_dir / "base_exe.json"))
+    env_local._clear_caches()
+    yield
+    env_local._clear_caches()
+
+
 def pytest_sessionfinish(session, exitstatus):
     """
     Clean up pytest temporary directories after the test session completes.
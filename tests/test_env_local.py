@@ -4,13 +4,15 @@ Test module for PythonLocal class.
 
 import os
 import sys
+import json
 import platform
 import subprocess
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 
 import pytest
 
+from env_manager import env_local
 from env_manager.env_local import PythonLocal
 
 
@@ -32,11 +34,10 @@ class TestPythonLocal:
         assert pl.python_path == custom_path
         assert pl.is_current is False
 
-    @patch('os.path.isfile')
-    @patch('os.access')
+    @patch('env_manager.env_local._is_executable')
     @patch('os.path.realpath')
     @patch('subprocess.run')
-    def test_find_base_executable_windows(self, mock_run, mock_realpath, mock_access, mock_isfile):
+    def test_find_base_executable_windows(self, mock_run, mock_realpath, mock_is_executable):
         """Test finding base executable on Windows."""
         # Create a more specific mock for os.environ.get
         def mock_environ_get(key, default=None):
@@ -54,19 +55,18 @@ class TestPythonLocal:
                 return default
 
         # Setup for Windows test
-        with patch('platform.system', return_value="Windows"), \
+        with patch('env_manager.env_local._IS_WINDOWS', True), \
              patch('sys.executable', 'C:\\venv\\Scripts\\python.exe'), \
              patch('os.environ.get', side_effect=mock_environ_get):
             
             # Mock file checks
-            def mock_isfile_side_effect(path):
+            def mock_is_executable_side_effect(path):
                 # Allow only paths that contain both "python.exe" and "\\Python"
                 if "python.exe" in path and "\\Python" in path:
                     return True
                 return False
                 
-            mock_isfile.side_effect = mock_isfile_side_effect
-            mock_access.return_value = True
+            mock_is_executable.side_effect = mock_is_executable_side_effect
             mock_realpath.return_value = "C:\\Python39\\python.exe"
             
             # Mock subprocess.run for version check
@@ -82,18 +82,17 @@ class TestPythonLocal:
             
             # Check that a Windows path was used in the search
             windows_path_found = False
-            for call in mock_isfile.call_args_list:
+            for call in mock_is_executable.call_args_list:
                 if "python.exe" in str(call) and "\\Python" in str(call):
                     windows_path_found = True
                     break
             assert windows_path_found
 
-    @patch('os.path.isfile')
-    @patch('os.access')
+    @patch('env_manager.env_local._is_executable')
     @patch('os.path.realpath')
     @patch('subprocess.run')
-    @patch('platform.python_version')
-    def test_find_base_executable_unix(self, mock_version, mock_run, mock_realpath, mock_access, mock_isfile):
+    @patch('env_manager.env_local._CURRENT_VERSION', "3.9.0")
+    def test_find_base_executable_unix(self, mock_run, mock_realpath, mock_is_executable):
         """Test finding base executable on Unix-like systems."""
         # Define expected Unix paths
         unix_paths = [
@@ -104,25 +103,21 @@ class TestPythonLocal:
         ]
         
         # Setup for Unix test
-        with patch('platform.system', return_value="Linux"), \
+        with patch('env_manager.env_local._IS_WINDOWS', False), \
              patch('sys.executable', '/home/user/venv/bin/python'), \
              patch('os.environ.get', return_value="/usr/bin"), \
              patch('sys.prefix', '/home/user/venv'), \
              patch('sys.base_prefix', '/usr'):
 
-            # Mock Python version
-            mock_version.return_value = "3.9.0"
-            
-            # Setup isfile mock to only return True for expected paths
+            # Setup executable mock to only return True for expected paths
             checked_paths = []
-            def isfile_side_effect(path):
+            def is_executable_side_effect(path):
                 checked_paths.append(path)
                 # Return True for expected Unix paths
                 return path in unix_paths
                 
-            mock_isfile.side_effect = isfile_side_effect
+            mock_is_executable.side_effect = is_executable_side_effect
             
-            mock_access.return_value = True
             mock_realpath.return_value = "/usr/bin/python3"
             
             # Mock subprocess.run for version checks
@@ -148,13 +143,11 @@ class TestPythonLocal:
                     
             assert unix_path_checked, "No Unix-style Python path was checked"
 
-    @patch('os.path.isfile')
-    @patch('os.access')
-    def test_find_base_executable_not_found(self, mock_access, mock_isfile):
+    @patch('env_manager.env_local._is_executable')
+    def test_find_base_executable_not_found(self, mock_is_executable):
         """Test behavior when base executable is not found."""
         # Mock file checks to always return False
-        mock_isfile.return_value = False
-        mock_access.return_value = False
+        mock_is_executable.return_value = False
         
         with patch('subprocess.run', side_effect=subprocess.SubprocessError):
             pl = PythonLocal()
@@ -164,11 +157,10 @@ class TestPythonLocal:
             assert result is None
 
     @patch('os.path.exists')
-    @patch('os.path.isfile')
-    @patch('os.access')
+    @patch('env_manager.env_local._is_executable')
     @patch('os.path.realpath')
     @patch('subprocess.run')
-    def test_find_base_executable_from_venv_cfg(self, mock_run, mock_realpath, mock_access, mock_isfile, mock_exists):
+    def test_find_base_executable_from_venv_cfg(self, mock_run, mock_realpath, mock_is_executable, mock_exists):
         """Test finding base executable from pyvenv.cfg."""
         # Setup mock file content
         mock_file_content = """
@@ -176,18 +168,14 @@ class TestPythonLocal:
         include-system-site-packages = false
         version = 3.9.0
         """
-        mock_open = MagicMock()
-        mock_open.return_value.__enter__.return_value.readlines.return_value = mock_file_content.splitlines()
-        
-        with patch('builtins.open', mock_open), \
-             patch('platform.system', return_value="Linux"), \
+        with patch('builtins.open', mock_open(read_data=mock_file_content)), \
+             patch('env_manager.env_local._IS_WINDOWS', False), \
              patch('sys.executable', '/home/user/venv/bin/python'), \
              patch('os.environ.get', return_value="/usr/bin"):
             
             # Mock file checks
             mock_exists.return_value = True
-            mock_isfile.return_value = True
-            mock_access.return_value = True
+            mock_is_executable.return_value = True
             mock_realpath.return_value = "/usr/bin/python3"
             
             # Mock subprocess.run for version check
@@ -201,13 +189,13 @@ class TestPythonLocal:
             # Should find the base Python executable
             assert result is not None
 
-    @patch('platform.system', return_value="Linux")
+    @patch('env_manager.env_local._IS_WINDOWS', False)
     @patch('subprocess.run')
-    def test_get_version(self, mock_run, _):
+    def test_get_version(self, mock_run):
         """Test getting Python version."""
         # Mock subprocess.run to return a version
         mock_completed_process = MagicMock()
-        mock_completed_process.stdout = "Python 3.9.0"
+        mock_completed_process.stdout = "/usr\n3.9.0\n/usr\n"
         mock_run.return_value = mock_completed_process
         
         pl = PythonLocal(python_path="/usr/bin/python3")
@@ -215,31 +203,43 @@ class TestPythonLocal:
         
         assert result == "3.9.0"
 
-    @patch('platform.system', return_value="Linux")
+    @patch('env_manager.env_local._IS_WINDOWS', False)
     @patch('subprocess.run')
-    def test_get_prefix(self, mock_run, _):
+    def test_get_prefix(self, mock_run):
         """Test getting Python prefix."""
         # Mock subprocess.run to return a prefix
         mock_completed_process = MagicMock()
-        mock_completed_process.stdout = "/usr/bin"
+        mock_completed_process.stdout = "/usr/bin\n3.9.0\n/usr/bin\n"
         mock_run.return_value = mock_completed_process
         
         pl = PythonLocal(python_path="/usr/bin/python3")
         result = pl._get_prefix()
         
         assert result == "/usr/bin"
+        
+        # The version came with the same interpreter run
+        assert pl._get_version() == "3.9.0"
+        mock_run.assert_called_once()
 
-    @patch('os.path.isfile')
-    @patch('os.access')
+    @patch('env_manager.env_local._IS_WINDOWS', False)
+    @patch('subprocess.run', side_effect=subprocess.TimeoutExpired("python", 2))
+    def test_get_prefix_fallback(self, _):
+        """Test deriving the prefix and version when the interpreter cannot be run."""
+        pl = PythonLocal(python_path="/home/user/venv/bin/python")
+        
+        with patch('os.path.realpath', return_value="/home/user/venv/bin/python"):
+            assert pl._get_prefix() == "/home/user/venv"
+        assert pl._get_version() == "3.0"
+
+    @patch('env_manager.env_local._is_executable')
     @patch('os.path.realpath')
     @patch('subprocess.run')
-    def test_get_base_name(self, mock_run, mock_realpath, mock_access, mock_isfile):
+    def test_get_base_name(self, mock_run, mock_realpath, mock_is_executable):
         """Test getting base folder name."""
         # Setup for test
-        with patch('platform.system', return_value="Linux"):
+        with patch('env_manager.env_local._IS_WINDOWS', False):
             # Mock file checks
-            mock_isfile.return_value = True
-            mock_access.return_value = True
+            mock_is_executable.return_value = True
             mock_realpath.return_value = "/usr/bin/python3"
             
             # Mock subprocess.run for version check
@@ -255,4 +255,201 @@ class TestPythonLocal:
             
             # Should return the base folder
             assert result is not None
-            assert "usr" in result
\ No newline at end of file
+            assert "usr" in result
+
+    def test_find_base_executable_disk_cache(self, tmp_path):
+        """Test that a cached base executable is reused until pyvenv.cfg changes."""
+        # Build a fake venv layout with a pyvenv.cfg next to the interpreter
+        venv_python = tmp_path / "venv" / "bin" / "python"
+        venv_python.parent.mkdir(parents=True)
+        venv_python.touch()
+        venv_cfg = tmp_path / "venv" / "pyvenv.cfg"
+        venv_cfg.write_text("home = /nonexistent\n")
+        base_python = tmp_path / "base" / "python3"
+        base_python.parent.mkdir()
+        base_python.touch()
+        
+        env_local._set_cached_base(str(venv_python), str(base_python))
+        
+        # Simulate a new process loading the cache from disk
+        env_local._disk_cache = None
+        with patch('subprocess.run') as mock_run:
+            pl = PythonLocal(python_path=str(venv_python))
+            assert pl.find_base_executable() == str(base_python)
+            mock_run.assert_not_called()
+        
+        # A modified pyvenv.cfg invalidates the cached entry
+        stat = os.stat(venv_cfg)
+        os.utime(venv_cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert env_local._get_cached_base(str(venv_python)) == (False, None)
+
+    @patch('env_manager.env_local._is_executable')
+    @patch('subprocess.run')
+    def test_find_base_executable_writes_disk_cache(self, mock_run, mock_is_executable):
+        """Test that a found base executable is persisted for later processes."""
+        mock_is_executable.return_value = True
+        mock_run.return_value = MagicMock(stdout="Python 3.9.0")
+        
+        pl = PythonLocal()
+        result = pl.find_base_executable()
+        assert result is not None
+        
+        with open(env_local._CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data[sys.executable]["base"] == result
+
+    def test_batch_probe(self):
+        """Test that batch probing reports each candidate's probe output."""
+        def run_side_effect(cmd, **kwargs):
+            if cmd[0] == '/broken/python':
+                raise subprocess.CalledProcessError(1, cmd)
+            return MagicMock(stdout='venv\n' if 'venv' in cmd[0] else 'system\n')
+        
+        with patch('subprocess.run', side_effect=run_side_effect):
+            result = env_local._batch_probe(['/usr/bin/python3', '/home/user/venv/bin/python', '/broken/python'])
+        
+        assert result == {
+            '/usr/bin/python3': 'system',
+            '/home/user/venv/bin/python': 'venv',
+            '/broken/python': None,
+        }
+        assert env_local._batch_probe([]) == {}
+
+    @patch('env_manager.env_local._is_executable')
+    @patch('subprocess.run')
+    def test_find_base_executable_shared_between_instances(self, mock_run, mock_is_executable):
+        """Test that instances for the same interpreter share one search."""
+        mock_is_executable.return_value = False
+        mock_run.return_value = MagicMock(stdout="/path/to/venv\n", stderr="")
+        
+        first = PythonLocal(python_path="/path/to/venv/bin/python")
+        first.find_base_executable()
+        calls = mock_run.call_count
+        
+        second = PythonLocal(python_path="/path/to/venv/bin/python")
+        second.find_base_executable()
+        second.get_base_name()
+        assert mock_run.call_count == calls
+
+    def test_is_executable_lists_directory_once(self, tmp_path):
+        """Test that executable checks share one directory listing and skip absent names."""
+        exe = tmp_path / "python3"
+        exe.touch()
+        exe.chmod(0o755)
+        
+        with patch('os.scandir', wraps=os.scandir) as mock_scandir, \
+             patch('os.stat', wraps=os.stat) as mock_stat:
+            assert env_local._is_executable(str(exe))
+            assert not env_local._is_executable(str(tmp_path / "python"))
+            assert not env_local._is_executable(str(tmp_path / "python3.9"))
+        
+        assert mock_scandir.call_count == 1
+        assert mock_stat.call_count == 1
+
+    @patch('env_manager.env_local._IS_WINDOWS', False)
+    @patch('env_manager.env_local._version_for', return_value="3.9.0")
+    @patch('env_manager.env_local._prefix_for')
+    @patch('subprocess.run')
+    def test_find_base_executable_venv_cfg_short_circuit(self, mock_run, mock_prefix, _, tmp_path):
+        """Test that a working pyvenv.cfg hit skips the remaining search methods."""
+        base_python = tmp_path / "base" / "bin" / "python"
+        base_python.parent.mkdir(parents=True)
+        base_python.touch()
+        base_python.chmod(0o755)
+        venv = tmp_path / "venv"
+        venv.mkdir()
+        (venv / "pyvenv.cfg").write_text(f"home = {base_python.parent}\nversion = 3.9.0\n")
+        mock_prefix.return_value = str(venv)
+        mock_run.return_value = MagicMock(stdout="system\n")
+        
+        pl = PythonLocal(python_path=str(venv / "bin" / "python"))
+        assert pl.find_base_executable() == str(base_python)
+        # Only the verification probe ran, not the base_prefix lookup of METHOD 2
+        assert mock_run.call_count == 1
+
+    def test_home_pattern(self):
+        """Test extracting the home key from pyvenv.cfg contents."""
+        data = "include-system-site-packages = false\n  home =  /usr/local/bin \r\nversion = 3.9.0\n"
+        assert env_local._HOME_RE.search(data).group(1) == "/usr/local/bin"
+        assert env_local._HOME_RE.search("version = 3.9.0\n") is None
+
+    def test_scan_dir(self, tmp_path):
+        """Test that a directory scan keeps the preference order of the names."""
+        for name in ("python", "python3.9", "pip"):
+            exe = tmp_path / name
+            exe.touch()
+            exe.chmod(0o755)
+        
+        result = env_local._scan_dir(str(tmp_path), ["python3.9", "python3", "python"])
+        assert result == [str(tmp_path / "python3.9"), str(tmp_path / "python")]
+        assert env_local._scan_dir(str(tmp_path / "missing"), ["python"]) == []
+
+    @patch('subprocess.run')
+    def test_find_base_executable_trusts_base_prefix(self, mock_run, tmp_path):
+        """Test that candidates reported by the interpreter itself are not verified by running them."""
+        base_python = tmp_path / "base" / "bin" / "python3"
+        base_python.parent.mkdir(parents=True)
+        base_python.touch()
+        base_python.chmod(0o755)
+        venv = tmp_path / "venv"
+        venv.mkdir()
+        
+        with patch('env_manager.env_local._IS_WINDOWS', False), \
+             patch('sys.prefix', str(venv)), \
+             patch('sys.base_prefix', str(tmp_path / "base")), \
+             patch('sys.base_executable', str(base_python), create=True):
+            pl = PythonLocal()
+            assert pl.find_base_executable() == str(base_python)
+        
+        mock_run.assert_not_called()
+
+    def test_find_base_executable_negative_cache(self, tmp_path):
+        """Test that a failed lookup is cached until it expires."""
+        venv_python = str(tmp_path / "venv" / "bin" / "python")
+        env_local._set_cached_base(venv_python, None)
+        
+        env_local._disk_cache = None
+        with patch('subprocess.run') as mock_run:
+            assert PythonLocal(python_path=venv_python).find_base_executable() is None
+            mock_run.assert_not_called()
+        
+        # An expired failure triggers a new search, the failure is not memoized in-process
+        with patch('time.time', return_value=env_local.time.time() + env_local._NEGATIVE_TTL + 1), \
+             patch('subprocess.run', side_effect=OSError) as mock_run:
+            assert env_local._get_cached_base(venv_python) == (False, None)
+            assert PythonLocal(python_path=venv_python).find_base_executable() is None
+            assert mock_run.called
+
+    def test_memos_expire(self, tmp_path):
+        """Test that directory listings are refreshed once the in-process memos expire."""
+        exe = tmp_path / "python3"
+        env_local._expire_memos()
+        assert not env_local._is_executable(str(exe))
+        exe.touch()
+        exe.chmod(0o755)
+        
+        # Still within the TTL, the earlier listing is reused
+        env_local._expire_memos()
+        assert not env_local._is_executable(str(exe))
+        
+        with patch('time.monotonic', return_value=env_local.time.monotonic() + env_local._MEMO_TTL + 1):
+            env_local._expire_memos()
+        assert env_local._is_executable(str(exe))
+
+    def test_first_working(self):
+        """Test that the most likely candidate is probed alone and the rest only when it fails."""
+        def run_side_effect(cmd, **kwargs):
+            if cmd[0] == '/broken/python':
+                raise subprocess.CalledProcessError(1, cmd)
+            return MagicMock(stdout='system\n')
+        
+        with patch('subprocess.run', side_effect=run_side_effect) as mock_run, \
+             patch('env_manager.env_local.ThreadPoolExecutor') as mock_pool:
+            assert env_local._first_working(['/usr/bin/python3', '/usr/bin/python']) == '/usr/bin/python3'
+            assert mock_run.call_count == 1
+            mock_pool.assert_not_called()
+        
+        with patch('subprocess.run', side_effect=run_side_effect):
+            assert env_local._first_working(['/broken/python', '/usr/bin/python']) == '/usr/bin/python'
+            assert env_local._first_working(['/broken/python']) is None
+            assert env_local._first_working([]) is None
@@ -4,14 +4,13 @@ Unit tests for the EnvManager class.
 
 import os
 import sys
-import shutil
 import logging
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 from venv import EnvBuilder
 
-from env_manager.env_manager import EnvManager
+from env_manager.env_manager import EnvManager, _remove_tree
 from env_manager.environment import Environment
 from env_manager.runners.irunner import IRunner
 
@@ -36,6 +35,7 @@ class TestEnvManager:
         env.root = "/mock/env/path"
         env.bin = "/mock/env/path/bin"
         env.lib = "/mock/env/path/lib"
+        env.site_packages = "/mock/env/path/lib/site-packages"
         env.python = "/mock/env/path/bin/python"
         env.is_virtual = True
         env.name = "mock_env"
@@ -142,7 +142,7 @@ class TestEnvManager:
             def create_venv_impl(clear=False):
                 os.makedirs(mock_env.root, exist_ok=True)
                 mock_env_builder.create(mock_env.root)
-                mock_logger.info(f"Created virtual environment at {mock_env.root}")
+                mock_logger.info("Created virtual environment at %s", mock_env.root)
                 return manager
                 
             # Replace the method
@@ -158,7 +158,7 @@ class TestEnvManager:
             mock_env_builder.create.assert_called_once_with("/mock/env/path")
             
             # Verify success was logged
-            mock_logger.info.assert_called_with(f"Created virtual environment at {mock_env.root}")
+            mock_logger.info.assert_called_with("Created virtual environment at %s", mock_env.root)
 
     def test_create_venv_exception(self, mock_env_builder, mock_logger):
         """Test error handling during virtual environment creation."""
@@ -191,7 +191,52 @@ class TestEnvManager:
             # Verify error was logged
             mock_logger.error.assert_called_once()
 
-    @patch("shutil.rmtree")
+    @pytest.mark.parametrize("kwargs,version,created", [
+        ({}, "{0}.{1}.0", False),
+        ({"clear": True}, "{0}.{1}.0", True),
+        ({"upgrade_deps": True}, "{0}.{1}.0", True),
+        ({}, "{0}.{2}.0", True),  # Built by another Python version
+    ])
+    def test_create_venv_reuses_existing(self, tmp_path, kwargs, version, created, mock_logger):
+        """Test an existing environment is only reused when it needs no changes."""
+        env = Environment(path=str(tmp_path / "venv"))
+        os.makedirs(env.bin)
+        major, minor = sys.version_info[:2]
+        (tmp_path / "venv" / "pyvenv.cfg").write_text(
+            f"home = /usr/bin\nversion = {version.format(major, minor, minor + 1)}\n")
+        open(env.python, "w").close()
+        
+        with patch("env_manager.env_manager.EnvBuilder") as mock_builder_cls:
+            EnvManager(path=env.root, logger=mock_logger, **kwargs)
+        
+        assert mock_builder_cls.return_value.create.called is created
+
+    def test_create_venv_runs_custom_builder_on_existing(self, tmp_path, mock_env_builder, mock_logger):
+        """Test a custom builder is run even when the environment already exists."""
+        env = Environment(path=str(tmp_path / "venv"))
+        os.makedirs(env.bin)
+        (tmp_path / "venv" / "pyvenv.cfg").write_text("home = /usr/bin")
+        open(env.python, "w").close()
+        
+        EnvManager(path=env.root, env_builder=mock_env_builder, logger=mock_logger)
+        
+        mock_env_builder.create.assert_called_once_with(env.root)
+
+    @pytest.mark.parametrize("kwargs,expected", [({}, False), ({"upgrade_deps": True}, True)])
+    def test_default_builder_upgrade_deps(self, kwargs, expected, mock_logger):
+        """Test the default builder only upgrades pip when asked to."""
+        mock_env = MagicMock(spec=Environment)
+        mock_env.is_virtual = True
+        mock_env.root = "/mock/env/path"
+        
+        with patch("env_manager.env_manager.Environment", return_value=mock_env), \
+             patch("env_manager.env_manager.EnvBuilder") as mock_builder_cls, \
+             patch("os.makedirs"):
+            EnvManager(logger=mock_logger, **kwargs)
+            
+            assert mock_builder_cls.call_args[1]["upgrade_deps"] is expected
+
+    @patch("env_manager.env_manager._remove_tree")
     def test_remove(self, mock_rmtree, mock_logger):
         """Test virtual environment removal."""
         # Configure mocks
@@ -211,13 +256,13 @@ class TestEnvManager:
             # Call remove
             manager.remove()
             
-            # Verify rmtree was called
+            # Verify the tree was removed
             mock_rmtree.assert_called_once_with("/mock/env/path")
             
             # Verify success was logged
-            mock_logger.info.assert_called_with(f"Removed virtual environment at {mock_env.root}")
+            mock_logger.info.assert_called_with("Removed virtual environment at %s", mock_env.root)
 
-    @patch("shutil.rmtree")
+    @patch("env_manager.env_manager._remove_tree")
     def test_remove_active_env(self, mock_rmtree, mock_logger):
         """Test removing an active virtual environment."""
         # Configure mocks
@@ -241,9 +286,45 @@ class TestEnvManager:
             # Verify deactivate was called before removal
             manager.deactivate.assert_called_once()
             
-            # Verify rmtree was called
+            # Verify the tree was removed
             mock_rmtree.assert_called_once_with("/mock/env/path")
 
+    def test_remove_tree(self, tmp_path):
+        """Test removing a tree with nested files and a link to an outside directory."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "kept.txt").write_text("kept")
+        root = tmp_path / "env"
+        nested = root / "lib" / "site-packages" / "pkg"
+        nested.mkdir(parents=True)
+        for i in range(20):
+            (nested / f"module{i}.py").write_text("")
+        (root / "pyvenv.cfg").write_text("home = /usr/bin")
+        os.symlink(outside, root / "lib" / "link", target_is_directory=True)
+
+        _remove_tree(str(root))
+
+        assert not root.exists()
+        assert (outside / "kept.txt").exists()
+
+    def test_remove_tree_rejects_symlinked_root(self, tmp_path):
+        """Test a link as the root is refused without touching the link target."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "kept.txt").write_text("kept")
+        link = tmp_path / "link"
+        os.symlink(target, link, target_is_directory=True)
+
+        with pytest.raises(OSError, match="symbolic link"):
+            _remove_tree(str(link))
+
+        assert (target / "kept.txt").exists()
+
+    def test_remove_tree_missing_root(self, tmp_path):
+        """Test removing a missing tree raises instead of succeeding silently."""
+        with pytest.raises(FileNotFoundError):
+            _remove_tree(str(tmp_path / "missing"))
+
     def test_prepare_command_python(self, mock_logger):
         """Test command preparation for Python commands."""
         # Configure mocks
@@ -256,37 +337,37 @@ class TestEnvManager:
         # Create EnvManager instance
         with patch("env_manager.env_manager.Environment", return_value=mock_env), \
              patch("os.path.exists") as mock_exists, \
-             patch("os.name", "posix"), \
              patch("env_manager.env_manager.EnvManager._create_venv", return_value=None):  # Patch _create_venv
             
-            # Mock activate script exists
             mock_exists.return_value = True
             
             manager = EnvManager(logger=mock_logger)
             
             # Test simple Python command
-            cmd, kwargs = manager.prepare_command("python", "script.py")
+            with patch.dict(os.environ, {"PATH": "/usr/bin", "PYTHONHOME": "/usr"}):
+                cmd, kwargs = manager.prepare_command("python", "script.py")
             
-            # Verify correct command format for Unix
-            assert isinstance(cmd, str)
-            assert 'source' in cmd
-            assert 'activate' in cmd
-            assert 'python script.py' in cmd
+            # Verify the environment's Python is run directly, without an activation shell
+            assert cmd == ["/mock/env/path/bin/python", "script.py"]
             
             # Verify kwargs
-            assert kwargs['shell'] is True
-            assert kwargs['executable'] == '/bin/bash'
+            assert kwargs['shell'] is False
+            assert 'close_fds' not in kwargs
+            assert 'executable' not in kwargs
             assert kwargs['text'] is True
             assert kwargs['check'] is True
             
-            # Test Python -c command (should be specially handled)
-            cmd, kwargs = manager.prepare_command("python", "-c", "print('test')")
+            # Verify the variables of the activated environment
+            assert kwargs['env']['VIRTUAL_ENV'] == "/mock/env/path"
+            assert kwargs['env']['PATH'] == "/mock/env/path/bin" + os.pathsep + "/usr/bin"
+            assert 'PYTHONHOME' not in kwargs['env']
             
-            # Verify command has quoted Python code
-            assert 'python -c "print(\'test\')"' in cmd
+            # Test Python -c command, the code is passed as a single argument
+            cmd, kwargs = manager.prepare_command("python", "-c", "print('test')")
+            assert cmd == ["/mock/env/path/bin/python", "-c", "print('test')"]
 
-    def test_prepare_command_no_activate(self, mock_logger):
-        """Test command preparation when no activate script exists."""
+    def test_prepare_command_env_python(self, mock_logger):
+        """Test command preparation resolving the environment's Python executable."""
         # Configure mocks
         mock_env = MagicMock(spec=Environment)
         mock_env.is_virtual = True
@@ -299,8 +380,8 @@ class TestEnvManager:
              patch("os.path.exists") as mock_exists, \
              patch("env_manager.env_manager.EnvManager._create_venv") as mock_create_venv:
             
-            # Mock activate script doesn't exist
-            mock_exists.side_effect = lambda path: 'activate' not in path and path == mock_env.python
+            # Only the environment's Python exists
+            mock_exists.side_effect = lambda path: path == mock_env.python
             
             # Create manager without running _create_venv
             manager = EnvManager(logger=mock_logger)
@@ -316,6 +397,26 @@ class TestEnvManager:
             # Verify kwargs
             assert kwargs['shell'] is False
 
+    def test_prepare_command_caches_command_paths(self, mock_environment, mock_logger):
+        """Test that command paths are resolved once until packages change."""
+        bin_pytest = os.path.join(mock_environment.bin, "pytest")
+        with patch("env_manager.env_manager.Environment", return_value=mock_environment), \
+             patch("os.path.exists", return_value=False) as mock_exists, \
+             patch("env_manager.env_manager.EnvManager._create_venv"):
+            manager = EnvManager(logger=mock_logger)
+            
+            cmd, _ = manager.prepare_command("pytest", "-q")
+            assert cmd == ["pytest", "-q"]
+            calls = mock_exists.call_count
+            manager.prepare_command("pytest", "-q")
+            assert mock_exists.call_count == calls
+            
+            # Installing a package may add the command to the environment
+            mock_exists.side_effect = lambda path: path == bin_pytest
+            manager.prepare_command("pip", "install", "pytest")
+            cmd, _ = manager.prepare_command("pytest", "-q")
+            assert cmd == [bin_pytest, "-q"]
+
     @patch("env_manager.runners.runner_factory.RunnerFactory.create")
     def test_get_runner(self, mock_factory_create, mock_logger):
         """Test getting a runner."""
@@ -351,6 +452,7 @@ class TestEnvManager:
         mock_env.root = "/mock/env/path"
         mock_env.bin = "/mock/env/path/bin"
         mock_env.lib = "/mock/env/path/lib"
+        mock_env.site_packages = "/mock/env/path/lib/site-packages"
 
         # Create EnvManager instance
         with patch("env_manager.env_manager.Environment", return_value=mock_env), \
@@ -371,8 +473,7 @@ class TestEnvManager:
             assert mock_env.bin in os.environ["PATH"]
             
             # Verify sys.path was updated
-            assert os.path.join(mock_env.lib, "site-packages") in sys.path
-            assert mock_env.lib in sys.path
+            assert sys.path == [mock_env.lib, mock_env.site_packages]
             
             # Verify method returns self
             assert result == manager
@@ -386,6 +487,68 @@ class TestEnvManager:
             # Verify method returns self
             assert result == manager
 
+    def test_prepare_command_inherits_activated_environ(self, mock_environment, mock_logger):
+        """Test commands inherit os.environ once the environment is activated in this process."""
+        with patch("env_manager.env_manager.Environment", return_value=mock_environment), \
+             patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True), \
+             patch("sys.path", []), \
+             patch("env_manager.env_manager.EnvManager._create_venv"):
+            manager = EnvManager(logger=mock_logger)
+            
+            _, kwargs = manager.prepare_command("pip", "list")
+            assert kwargs['env']['VIRTUAL_ENV'] == mock_environment.root
+            
+            with manager:
+                _, kwargs = manager.prepare_command("pip", "list")
+                assert kwargs['env'] is None
+
+    def test_deactivate_restores_only_activation_vars(self, mock_environment, mock_logger):
+        """Test that deactivation undoes only the activation changes and keeps other changes."""
+        with patch("env_manager.env_manager.Environment", return_value=mock_environment), \
+             patch.dict("os.environ", {"PATH": "/usr/bin", "PYTHONHOME": "/usr"}, clear=True), \
+             patch("sys.path", []), \
+             patch("env_manager.env_manager.EnvManager._create_venv"):
+            manager = EnvManager(logger=mock_logger)
+            
+            manager.activate()
+            assert "PYTHONHOME" not in os.environ
+            os.environ["SET_WHILE_ACTIVE"] = "1"
+            sys.path.append("/added/while/active")
+            manager.deactivate()
+            
+            assert os.environ == {"PATH": "/usr/bin", "PYTHONHOME": "/usr", "SET_WHILE_ACTIVE": "1"}
+            assert sys.path == ["/added/while/active"]
+
+    def test_deactivate_keeps_sys_path_when_not_activated_here(self, mock_environment, mock_logger):
+        """Test deactivating an environment activated outside this instance leaves sys.path alone."""
+        with patch("env_manager.env_manager.Environment", return_value=mock_environment), \
+             patch.dict("os.environ", {"VIRTUAL_ENV": mock_environment.root}, clear=True), \
+             patch("sys.path", ["/kept"]), \
+             patch("env_manager.env_manager.EnvManager._create_venv"):
+            manager = EnvManager(logger=mock_logger)
+            
+            sys.path.append("/added/later")
+            manager.deactivate()
+            
+            assert sys.path == ["/kept", "/added/later"]
+            assert "VIRTUAL_ENV" not in os.environ
+
+    def test_deactivate_does_not_restore_stale_values(self, mock_environment, mock_logger):
+        """Test a deactivate after an external activation does not reapply an earlier snapshot."""
+        with patch("env_manager.env_manager.Environment", return_value=mock_environment), \
+             patch.dict("os.environ", {"PATH": "/usr/bin"}, clear=True), \
+             patch("sys.path", []), \
+             patch("env_manager.env_manager.EnvManager._create_venv"):
+            manager = EnvManager(logger=mock_logger)
+            manager.activate()
+            manager.deactivate()
+            
+            # Activated again from outside this instance, with a different PATH
+            os.environ.update({"VIRTUAL_ENV": mock_environment.root, "PATH": "/opt/bin"})
+            manager.deactivate()
+            
+            assert os.environ == {"PATH": "/opt/bin"}
+
     def test_is_active(self):
         """Test is_active method."""
         # Configure mocks
@@ -198,7 +198,8 @@ print("Virtual env:", os.environ.get('VIRTUAL_ENV', 'None'))
         """Test environment variables preservation and restoration."""
         # Set a custom environment variable
         os.environ["TEST_VAR"] = "test_value"
-        original_environ = dict(os.environ)
+        original_path = os.environ["PATH"]
+        original_venv = os.environ.get("VIRTUAL_ENV")
         
         try:
             with env_manager:
@@ -208,13 +209,15 @@ print("Virtual env:", os.environ.get('VIRTUAL_ENV', 'None'))
                 # Add a new variable
                 os.environ["VENV_VAR"] = "venv_value"
             
-            # Original environment should be restored
+            # Variables changed by activation should be restored, the rest left alone
+            assert os.environ["PATH"] == original_path
+            assert os.environ.get("VIRTUAL_ENV") == original_venv
             assert os.environ["TEST_VAR"] == "test_value"
-            assert "VENV_VAR" not in os.environ
+            assert os.environ["VENV_VAR"] == "venv_value"
         finally:
             # Cleanup
-            if "TEST_VAR" in os.environ:
-                del os.environ["TEST_VAR"]
+            for key in ("TEST_VAR", "VENV_VAR"):
+                os.environ.pop(key, None)
     
     def test_environment_class(self, tmp_path):
         """Test Environment class integration with EnvManager."""
@@ -33,6 +33,7 @@ class TestEnvironment:
                 assert env.bin == '/fake/path/bin'
                 assert env.lib == '/fake/path/lib'
                 assert env.python == '/fake/path/bin/python'
+            assert env.site_packages == os.path.join(env.lib, 'site-packages')
 
     def test_initialization_with_path(self):
         """Test initialization with a specific path."""
@@ -42,6 +43,13 @@ class TestEnvironment:
             assert env.root == test_path
             assert env.name == 'venv'
 
+    def test_attributes_resolved_on_access(self):
+        """Test only the root is computed on construction, the rest on first access."""
+        env = Environment(path=os.path.abspath('/lazy/venv'))
+        assert set(vars(env)) == {'root'}
+        assert env.lib == os.path.join(env.root, 'Lib' if os.name == 'nt' else 'lib')
+        assert set(vars(env)) == {'root', 'lib'}
+
     def test_initialization_with_virtual_env(self):
         """Test initialization using VIRTUAL_ENV environment variable."""
         virtual_env_path = '/test/virtual/env'
@@ -51,23 +59,20 @@ class TestEnvironment:
             assert env.root == virtual_env_path
             assert env.name == 'env'
 
-    def test_initialization_with_kwargs(self):
-        """Test initialization with direct attribute kwargs."""
-        env = Environment(
-            root='/custom/path',
-            name='custom_env',
-            bin='/custom/path/bin',
-            lib='/custom/path/lib',
-            python='/custom/path/bin/python',
-            is_virtual=True
-        )
-        assert env.root == '/custom/path'
-        assert env.name == 'custom_env'
-        assert env.bin == '/custom/path/bin'
-        assert env.lib == '/custom/path/lib'
-        assert env.python == '/custom/path/bin/python'
+    def test_from_dict_derives_missing_attributes(self):
+        """Test attributes left out of from_dict are derived from the root."""
+        root = os.path.abspath('/custom/path')
+        env = Environment.from_dict({'root': root, 'is_virtual': True})
+        assert env.root == root
+        assert env.name == 'path'
+        assert env.bin == os.path.join(root, 'Scripts' if os.name == 'nt' else 'bin')
         assert env.is_virtual is True
 
+    def test_initialization_rejects_kwargs(self):
+        """Test attributes can only be set directly through from_dict."""
+        with pytest.raises(TypeError):
+            Environment(root='/custom/path')
+
     @pytest.mark.parametrize('path,expected', [
         # Windows patterns
         ('C:\\Python39', True),
@@ -189,5 +189,23 @@ class TestLocalRunner:
         
         # Verify error was logged
         local_runner.logger.error.assert_called_once_with(
-            "Failed to execute local command: Test error"
-        )
\ No newline at end of file
+            "Failed to execute local command: %s", mock_subprocess_run.side_effect
+        )
+
+    @patch('env_manager.env_local.PythonLocal.find_base_executable')
+    @patch('subprocess.run')
+    def test_base_executable_resolved_once(self, mock_subprocess_run, mock_find_base_executable, local_runner):
+        """Test that the base executable lookup is reused across runs."""
+        mock_find_base_executable.return_value = '/path/to/base/python'
+        mock_subprocess_run.return_value = MagicMock(spec=subprocess.CompletedProcess)
+        
+        # Non-Python commands never need the base executable
+        local_runner.run('pip', 'list')
+        mock_find_base_executable.assert_not_called()
+        
+        local_runner.run('python', '-c', "print('one')")
+        local_runner.run('python', '-c', "print('two')")
+        
+        # Lookup happens only on the first Python command
+        mock_find_base_executable.assert_called_once()
+        assert mock_subprocess_run.call_args[0][0][0] == '/path/to/base/python'
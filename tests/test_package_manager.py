@@ -7,7 +7,7 @@ from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-from env_manager.package_manager import PackageManager, InstallPkgContextManager
+from env_manager.package_manager import PackageManager, InstallPkgContextManager, _PIP_FLAGS
 
 
 class TestPackageManager:
@@ -39,6 +39,20 @@ class TestPackageManager:
         assert pm.runner == mock_runner
         assert result == pm  # Should return self for chaining
 
+    def test_missing_packages(self, package_manager, mock_runner):
+        """Test missing_packages checks all packages with a single pip call."""
+        mock_runner.run.return_value = MagicMock(
+            stdout="Typing_Extensions==4.0.0\nrequests==2.31.0\nmy-pkg @ file:///tmp/my_pkg\n"
+        )
+        
+        result = package_manager.missing_packages(
+            "requests>=2.0", "typing-extensions", "my_pkg", "wheel", "build"
+        )
+        
+        # Only the packages not in the listing are reported, in request order
+        assert result == ["wheel", "build"]
+        mock_runner.run.assert_called_once_with("pip", "list", *_PIP_FLAGS, "--format=freeze", capture_output=True)
+
     def test_install_pkg_context_manager(self, package_manager, mock_runner):
         """Test the install_pkg context manager."""
         # Use the context manager
@@ -48,35 +62,27 @@ class TestPackageManager:
             
             # Verify runner.run was called to install package
             mock_runner.run.assert_called_with(
-                "pip", "install", "test-package", capture_output=True
+                "pip", "install", *_PIP_FLAGS, "test-package", capture_output=True
             )
 
         # Verify runner.run was called to uninstall package after context exit
         calls = mock_runner.run.call_args_list
         assert len(calls) == 2
-        assert calls[1] == call("pip", "uninstall", "-y", "test-package", capture_output=True)
+        assert calls[1] == call("pip", "uninstall", *_PIP_FLAGS, "-y", "test-package", capture_output=True)
 
     def test_install_multiple_packages(self, package_manager, mock_runner):
         """Test installing multiple packages."""
         # Use the context manager with multiple packages
         packages = ["pkg1", "pkg2", "pkg3"]
         with package_manager.install_pkg(*packages) as cm:
-            # Verify runner.run was called for each package
-            assert mock_runner.run.call_count == 3
-            
-            # Verify all packages were installed
-            for package in packages:
-                mock_runner.run.assert_any_call("pip", "install", package, capture_output=True)
+            # Verify all packages were installed with a single pip call
+            mock_runner.run.assert_called_once_with("pip", "install", *_PIP_FLAGS, *packages, capture_output=True)
             
             # Reset the mock to track only uninstall calls
             mock_runner.reset_mock()
 
-        # Verify uninstall was called for each package (3 calls for installs + 3 calls for uninstalls)
-        assert mock_runner.run.call_count == 3
-            
-        # Verify all packages were uninstalled
-        for package in packages:
-            mock_runner.run.assert_any_call("pip", "uninstall", "-y", package, capture_output=True)
+        # Verify all packages were uninstalled with a single pip call
+        mock_runner.run.assert_called_once_with("pip", "uninstall", *_PIP_FLAGS, "-y", *packages, capture_output=True)
 
     def test_install_with_options(self, package_manager, mock_runner):
         """Test installing with pip options."""
@@ -197,4 +203,18 @@ class TestInstallPkgContextManager:
         assert mock_runner.run.call_count == 1
         
         # And exception wasn't suppressed
-        assert cm.__exit__(ValueError, exception, None) is None
\ No newline at end of file
+        assert cm.__exit__(ValueError, exception, None) is None
+
+    def test_nested_context_installs_once(self, package_manager, mock_runner):
+        """Test nested with blocks on one instance install and uninstall once."""
+        cm = InstallPkgContextManager(package_manager, "test-package")
+        mock_runner.reset_mock()
+        
+        with cm:
+            with cm:
+                assert mock_runner.run.call_count == 1
+            # The inner exit keeps the package for the outer block
+            assert mock_runner.run.call_count == 1
+        
+        assert mock_runner.run.call_count == 2
+        assert mock_runner.run.call_args_list[1][0][:2] == ("pip", "uninstall")
@@ -143,6 +143,48 @@ class TestGlobalState:
         for key, value in complex_data.items():
             assert new_state[key] == value
     
+    def test_save_skips_unchanged_state(self, state):
+        """Test that saving an unchanged state does not rewrite the file"""
+        state.update('test_key', 'test_value')
+        state.save()
+        
+        with patch('os.replace') as mock_replace:
+            state.save()
+            mock_replace.assert_not_called()
+        
+        # In-place changes to nested values are still detected
+        state['nested'] = [1, 2]
+        state.save()
+        state['nested'].append(3)
+        state.save()
+        
+        new_state = GlobalState(app_name="TestApp", config_dir=state.config_dir)
+        assert new_state['nested'] == [1, 2, 3]
+        assert os.listdir(state.config_dir) == [os.path.basename(state.full_path)]
+    
+    def test_save_removes_temp_file_on_failure(self, state):
+        """Test that a failed replace leaves neither a temp file nor a changed config"""
+        state['key'] = 'value'
+        state.save()
+        
+        state['key'] = 'changed'
+        with patch('os.replace', side_effect=PermissionError("Permission denied")):
+            with pytest.raises(PermissionError):
+                state.save()
+        
+        assert os.listdir(state.config_dir) == [os.path.basename(state.full_path)]
+        assert GlobalState(app_name="TestApp", config_dir=state.config_dir)['key'] == 'value'
+    
+    def test_save_after_load_skips_write(self, state):
+        """Test that a freshly loaded state is not written back on save"""
+        state.update('test_key', 'test_value')
+        state.save()
+        
+        new_state = GlobalState(app_name="TestApp", config_dir=state.config_dir)
+        with patch('os.replace') as mock_replace:
+            new_state.save()
+            mock_replace.assert_not_called()
+    
     def test_reset(self, state):
         """Test resetting state"""
         state.update('test_key', 'test_value')
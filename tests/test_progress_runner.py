@@ -150,5 +150,5 @@ class TestProgressRunner:
         
         # Verify error was logged
         mock_env_manager.logger.error.assert_called_once_with(
-            "Failed to execute command: Test error"
+            "Failed to execute command: %s", mock_subprocess_run.side_effect
         )
\ No newline at end of file
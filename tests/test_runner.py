@@ -2,7 +2,6 @@
 Test module for standard Runner class.
 """
 
-import os
 import subprocess
 from unittest.mock import MagicMock, patch
 
@@ -74,7 +73,6 @@ class TestRunner:
         # Verify subprocess.run was called with the prepared command
         mock_subprocess_run.assert_called_once_with(
             ["python", "-m", "pip", "list"], 
-            env=os.environ, 
             capture_output=True, 
             text=True
         )
@@ -113,7 +111,7 @@ class TestRunner:
         
         # Verify error was logged
         mock_env_manager.logger.error.assert_called_once_with(
-            "Failed to execute command: Test error"
+            "Failed to execute command: %s", mock_subprocess_run.side_effect
         )
 
     @patch("subprocess.run")
@@ -142,6 +140,5 @@ class TestRunner:
         # Verify subprocess.run was called with the prepared command
         mock_subprocess_run.assert_called_once_with(
             ["python", "-c", "print('test')"],
-            env=os.environ,
             capture_output=False
         )
\ No newline at end of file